@@ -1,18 +1,18 @@
 """implements the Backoffice CLI"""
 
+from __future__ import annotations
+
 import warnings
 from datetime import datetime
 from pathlib import Path
-from typing import Literal, Optional, Union
+from typing import TYPE_CHECKING, Dict, Literal, Optional, Tuple, Union
 
-from bioimageio.spec.model.v0_5 import WeightsFormat
 from loguru import logger
 
 from ._settings import settings
-from .backup import backup
 from .db_structure.chat import Chat, Message
 from .db_structure.log import Log, LogEntry
-from .mailroom.send_email import notify_uploader
+from .mailroom.send_email import enqueue_notify_uploader, flush_outbox
 from .remote_collection import (
     Record,
     RecordDraft,
@@ -20,9 +20,10 @@ from .remote_collection import (
     draft_new_version,
     get_remote_resource_version,
 )
-from .run_dynamic_tests import run_dynamic_tests
 from .s3_client import Client
-from .validate_format import validate_format
+
+if TYPE_CHECKING:
+    from bioimageio.spec.model.v0_5 import WeightsFormat
 
 
 class BackOffice:
@@ -30,26 +31,47 @@ class BackOffice:
 
     def __init__(
         self,
-        host: str = settings.s3_host,
-        bucket: str = settings.s3_bucket,
-        prefix: str = settings.s3_folder,
+        host: Optional[str] = None,
+        bucket: Optional[str] = None,
+        prefix: Optional[str] = None,
     ) -> None:
+        """
+        Args:
+            host: S3 host (default: `settings.s3_host`)
+            bucket: S3 bucket (default: `settings.s3_bucket`)
+            prefix: S3 prefix (default: `settings.s3_folder`)
+        """
         super().__init__()
-        self.client = Client(host=host, bucket=bucket, prefix=prefix)
+        self.client = Client(
+            host=host or settings.s3_host,
+            bucket=bucket or settings.s3_bucket,
+            prefix=prefix or settings.s3_folder,
+        )
+        self._remote_resource_versions: Dict[
+            Tuple[str, str], Union[Record, RecordDraft]
+        ] = {}
         logger.info("created backoffice with client {}", self.client)
 
+    def _get_rv(self, concept_id: str, version: str) -> Union[Record, RecordDraft]:
+        """get a (cached) remote resource version"""
+        key = (concept_id, str(version))
+        rv = self._remote_resource_versions.get(key)
+        if rv is None:
+            rv = get_remote_resource_version(self.client, concept_id, version)
+            if key[1] != "latest":  # 'latest' may change
+                self._remote_resource_versions[key] = rv
+
+        return rv
+
     def download(self, in_collection_path: str, output_path: Optional[Path] = None):
         """downlaod a file from the collection (using the MinIO client)"""
-        data = self.client.load_file(in_collection_path)
-        if data is None:
-            raise FileNotFoundError(
-                f"failed to download {self.client.get_file_url(in_collection_path)}"
-            )
-
         if output_path is None:
             output_path = Path(in_collection_path)
 
-        _ = output_path.write_bytes(data)
+        if not self.client.download(in_collection_path, str(output_path)):
+            raise FileNotFoundError(
+                f"failed to download {self.client.get_file_url(in_collection_path)}"
+            )
 
     def log(self, message: str, concept_id: str, version: str):
         """log a message"""
@@ -57,14 +79,15 @@ class BackOffice:
         if not settings.run_url:
             raise ValueError("'RUN_URL' not set")
 
-        rv = get_remote_resource_version(self.client, concept_id, version)
+        rv = self._get_rv(concept_id, version)
         rv.extend_log(Log(entries=[LogEntry(message=message)]))
 
     def wipe(self, subfolder: str = ""):
         """DANGER ZONE: wipes `subfolder` completely, only use for test folders!"""
-        url = self.client.get_file_url(subfolder)
         key_parts = ("sandbox", "testing")
-        if not any(p in url for p in key_parts):
+        # only the S3 prefix and subfolder may mark a test folder (not host or bucket)
+        if not any(p in f"{self.client.prefix}/{subfolder}" for p in key_parts):
+            url = self.client.get_file_url(subfolder)
             raise RuntimeError(f"Refusing to wipe {url} (missing any of {key_parts})")
 
         self.client.rm_dir(subfolder)
@@ -85,7 +108,9 @@ class BackOffice:
 
     def validate_format(self, concept_id: str, version: str):
         """validate a resource version's rdf.yaml"""
-        rv = get_remote_resource_version(self.client, concept_id, version)
+        from .validate_format import validate_format
+
+        rv = self._get_rv(concept_id, version)
         validate_format(rv)
 
     def test(
@@ -97,7 +122,9 @@ class BackOffice:
         conda_env_file: Union[str, Path] = Path("environment.yaml"),
     ):
         """run dynamic tests for a (staged) resource version"""
-        rv = get_remote_resource_version(self.client, concept_id, version)
+        from .run_dynamic_tests import run_dynamic_tests
+
+        rv = self._get_rv(concept_id, version)
         if (
             isinstance(rv, RecordDraft)
             and (rv_status := rv.info.status) is not None
@@ -121,7 +148,7 @@ class BackOffice:
             and rv_status.name == "testing"
         ):
             rv.await_review()
-            notify_uploader(
+            enqueue_notify_uploader(
                 rv,
                 "is awaiting review ⌛",
                 f"Thank you for submitting {rv.concept_id}!\n"
@@ -151,7 +178,7 @@ class BackOffice:
             raise ValueError(f"'{rv.id}' not found")
 
         rv.request_changes(reviewer, reason=reason)
-        notify_uploader(
+        enqueue_notify_uploader(
             rv,
             "needs changes 📑",
             f"Thank you for submitting {rv.concept_id}!\n"
@@ -173,14 +200,10 @@ class BackOffice:
             raise ValueError("Missing `reviewer`")
 
         rv = RecordDraft(client=self.client, concept_id=concept_id)
-
-        if isinstance(rv, Record):
-            raise ValueError(f"Cannot publish already published {concept_id} {version}")
-
-        published: Record = rv.publish(reviewer)
-        assert isinstance(published, Record)
+        published = rv.publish(reviewer)
+        _ = self._remote_resource_versions.pop((concept_id, "draft"), None)
         self.generate_collection_json(mode="published")
-        notify_uploader(
+        enqueue_notify_uploader(
             published,
             "was published! 🎉",
             f"Thank you for contributing {published.id} to bioimage.io! 🙏.\n"
@@ -195,16 +218,35 @@ class BackOffice:
         if destination != "deprecated":
             logger.warning("argument `destination` is deprecated")
 
-        _ = backup(self.client)
+        from .backup import backup
+
+        backed_up = backup(self.client)
+        if not backed_up:
+            logger.info("nothing new backed up; collection json files are up to date")
+            return
+
         self.generate_collection_json(mode="published")
         self.generate_collection_json(mode="draft")
 
     def generate_collection_json(
         self,
         mode: Literal["published", "draft"] = "published",
+        full_rebuild: bool = False,
     ):
-        """generate the collection.json file --- a summary of the whole collection"""
-        RemoteCollection(self.client).generate_collection_json(mode=mode)
+        """generate the collection.json file --- a summary of the whole collection
+
+        Args:
+            mode: generate the collection of published or draft resources
+            full_rebuild: regenerate the entries of all resources,
+                not only of those that changed since the last run
+        """
+        RemoteCollection(self.client).generate_collection_json(
+            mode=mode, full_rebuild=full_rebuild
+        )
+
+    def flush_mailroom(self):
+        """send all queued emails"""
+        flush_outbox(self.client)
 
     def forward_emails_to_chat(self):
         logger.error("disabled")
@@ -222,10 +264,10 @@ class BackOffice:
                 Message(author=author, text=chat_message, timestamp=datetime.now())
             ]
         )
-        rv = get_remote_resource_version(self.client, concept_id, version)
+        rv = self._get_rv(concept_id, version)
         rv.extend_chat(chat)
         return rv.chat
 
     def get_chat(self, concept_id: str, version: str) -> Chat:
-        rv = get_remote_resource_version(self.client, concept_id, version)
+        rv = self._get_rv(concept_id, version)
         return rv.chat
@@ -1,10 +1,13 @@
 import getpass
+from pathlib import Path
 from typing import Literal, Optional
 
 from loguru import logger
 from pydantic import SecretStr
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
+_USER = getpass.getuser()
+
 
 class Settings(BaseSettings, extra="ignore"):
     """environment variables for bioimageio_collection_backoffice"""
@@ -13,6 +16,7 @@ class Settings(BaseSettings, extra="ignore"):
         case_sensitive=False,
         env_file=".env",
         env_file_encoding="utf-8",
+        frozen=True,
     )
 
     github_issue_number: Optional[int] = None
@@ -25,15 +29,18 @@ class Settings(BaseSettings, extra="ignore"):
     )
     """collection config"""
 
+    cache_path: Path = Path("~/.cache/bioimageio_collection_backoffice").expanduser()
+    """local cache directory"""
+
     run_url: Optional[str] = None
     """url to logs of the current CI run"""
 
     s3_host: str = "uk1s3.embassy.ebi.ac.uk"
     s3_bucket: str = "public-datasets"
-    s3_folder: str = f"testing.bioimage.io/{getpass.getuser()}/instance"
-    s3_pytest_folder: str = f"testing.bioimage.io/{getpass.getuser()}/pytest"
+    s3_folder: str = f"testing.bioimage.io/{_USER}/instance"
+    s3_pytest_folder: str = f"testing.bioimage.io/{_USER}/pytest"
     s3_sandbox_folder: str = "sandbox.bioimage.io"
-    s3_test_folder: str = f"testing.bioimage.io/{getpass.getuser()}/sandbox"
+    s3_test_folder: str = f"testing.bioimage.io/{_USER}/sandbox"
     test_package_id: str = "frank-water-buffalo"
     test_package_url: str = (
         "https://uk1s3.embassy.ebi.ac.uk/public-datasets/examples.bioimage.io/frank-water-buffalo_v1.zip"
@@ -47,6 +54,9 @@ class Settings(BaseSettings, extra="ignore"):
 
     bioimageio_user_id: Optional[str] = None
 
+    force_retest: bool = False
+    """rerun dynamic tests even if a passed test result for the same inputs exists"""
+
     # secrets
     mail_password: SecretStr = SecretStr("")
     s3_access_key_id: SecretStr = SecretStr("")
@@ -57,4 +67,4 @@ class Settings(BaseSettings, extra="ignore"):
 
 
 settings = Settings()
-logger.info("settings: {}", settings)
+logger.debug("settings: {}", settings)
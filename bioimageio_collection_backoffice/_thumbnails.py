@@ -1,6 +1,6 @@
 from io import BytesIO
 from pathlib import PurePosixPath
-from typing import Any, Dict, List, Optional, Tuple, Union
+from typing import IO, Any, Container, Dict, List, Optional, Tuple, Union
 from zipfile import ZipFile
 
 from bioimageio.spec.common import FileName
@@ -8,56 +8,60 @@ from loguru import logger
 from PIL import Image
 
 THUMBNAIL_SUFFIX = ".thumbnail.png"
+_COVER_SIZE = (600, 340)
+_ICON_SIZE = (320, 320)
 
 
 def create_thumbnails(
     rdf: Dict[str, Any], zip: ZipFile
-) -> Dict[FileName, Tuple[FileName, bytes]]:
+) -> List[Tuple[FileName, FileName, bytes]]:
+    """create thumbnails for covers, badge icons and icon of **rdf**
+
+    Returns:
+        (source file name, thumbnail file name, thumbnail data) for each thumbnail
+    """
     covers: Union[Any, List[Any]] = rdf.get("covers")
     plan: List[Tuple[Any, Tuple[int, int]]] = []
     if isinstance(covers, list):
         covers_list: List[Any] = covers
-        plan.extend((src, (600, 340)) for src in covers_list)
+        plan.extend((src, _COVER_SIZE) for src in covers_list)
 
     badges: Union[Any, List[Any]] = rdf.get("badges")
     if isinstance(badges, list):
         badges_list: List[Any] = badges
-        for badge in badges_list:
-            if not isinstance(badge, dict):
-                continue
-
-            icon: Any = badge.get("icon")
-            plan.append((icon, (320, 320)))
+        plan.extend(
+            (badge.get("icon"), _ICON_SIZE)
+            for badge in badges_list
+            if isinstance(badge, dict)
+        )
 
-    plan.append((rdf.get("icon"), (320, 320)))
+    plan.append((rdf.get("icon"), _ICON_SIZE))
 
-    thumbnails: Dict[FileName, Tuple[FileName, bytes]] = {}
+    # process each source only once (the first requested size wins,
+    # as the thumbnail name only depends on the source)
+    unique_plan: Dict[str, Tuple[int, int]] = {}
     for src, size in plan:
-        thumbnail = _get_thumbnail(src, zip, size)
-        if thumbnail is None:
-            continue
-
-        name, thumbnail_name, data = thumbnail
-        if name in thumbnails:
-            if (thumbnail_name, data) != thumbnails[name]:
-                logger.error("duplicated thumbnail name '{name}'")
+        if isinstance(src, str):
+            _ = unique_plan.setdefault(src, size)
 
-            continue
-
-        thumbnails[name] = (thumbnail_name, data)
+    zip_file_names = zip.NameToInfo  # name lookup built by zipfile when opening
+    # sources are unique, so are the (source) names of their thumbnails
+    thumbnails: List[Tuple[FileName, FileName, bytes]] = []
+    for src, size in unique_plan.items():
+        thumbnail = _get_thumbnail(src, zip, zip_file_names, size)
+        if thumbnail is not None:
+            thumbnails.append(thumbnail)
 
     return thumbnails
 
 
 def _get_thumbnail(
-    src: Any, zip: ZipFile, size: Tuple[int, int]
+    src: Any, zip: ZipFile, zip_file_names: Container[str], size: Tuple[int, int]
 ) -> Optional[Tuple[FileName, FileName, bytes]]:
     if not isinstance(src, str) or src.endswith(THUMBNAIL_SUFFIX):
         return  # invalid or already a thumbnail
 
-    zip_file_names = set(zip.namelist())
     if src in zip_file_names:
-        src_data = zip.open(src).read()
         image_name = src
     else:
         if isinstance(src, str) and src.startswith("http"):
@@ -75,7 +79,9 @@ def _get_thumbnail(
         # image_name = src_download.original_file_name
         # src_data = src_download.path.read_bytes()
 
-    data = _downsize_image(src_data, size)
+    with zip.open(image_name) as src_file:
+        data = _downsize_image(src_file, size)
+
     if data is None:
         return None
     else:
@@ -89,14 +95,24 @@ def _get_thumbnail(
         )
 
 
-def _downsize_image(image_data: bytes, size: Tuple[int, int]) -> Optional[bytes]:
-    """downsize an image"""
+def _downsize_image(image_file: IO[bytes], size: Tuple[int, int]) -> Optional[bytes]:
+    """downsize an image read from **image_file**"""
 
     try:
-        with Image.open(BytesIO(image_data)) as img:
-            img.thumbnail(size)
+        with Image.open(image_file) as img:
+            if img.format == "PNG" and img.width <= size[0] and img.height <= size[1]:
+                # small enough already; reuse the original PNG data
+                _ = image_file.seek(0)
+                return image_file.read()
+
+            if img.format == "JPEG":
+                # let libjpeg downscale while decoding
+                _ = img.draft("RGB", size)
+
+            img.thumbnail(size, resample=Image.Resampling.BILINEAR, reducing_gap=2.0)
             img_bytes_io = BytesIO()
-            img.save(img_bytes_io, format="PNG")
+            # thumbnails are small; favor encoding speed over compression
+            img.save(img_bytes_io, format="PNG", optimize=False, compress_level=1)
             return img_bytes_io.getvalue()
     except Exception as e:
         logger.warning(str(e))
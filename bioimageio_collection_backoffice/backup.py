@@ -1,12 +1,10 @@
 import traceback
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
-from io import BytesIO
 from pathlib import PurePosixPath
 from typing import Any, Dict, List
 from urllib.parse import quote_plus
 
-import markdown
-import requests
 from bioimageio.spec import (
     InvalidDescr,
     ResourceDescr,
@@ -19,7 +17,11 @@ from loguru import logger
 
 from ._settings import settings
 from .remote_collection import Record, RemoteCollection
-from .requests_utils import put_file, raise_for_status_discretely
+from .requests_utils import (
+    get_session,
+    put_file_from_url,
+    raise_for_status_discretely,
+)
 from .s3_client import Client
 
 
@@ -27,37 +29,67 @@ class SkipForNow(NotImplementedError):
     pass
 
 
-def backup(client: Client):
-    """backup all published resources to their own zenodo records"""
+def backup(client: Client, max_workers: int = 4):
+    """backup all published resources to their own zenodo records
+
+    Args:
+        client: S3 client of the collection to back up
+        max_workers: number of resource concepts backed up concurrently
+
+    Returns:
+        ids of the newly backed up resource versions
+    """
     remote_collection = RemoteCollection(client=client)
 
-    backed_up: List[str] = []
-    error = None
+    # versions of a concept build on each other's zenodo concept and are backed up
+    # in order; different concepts are backed up concurrently.
+    # (already backed up versions have a doi, so an interrupted backup resumes)
+    pending: Dict[str, List[Record]] = {}
     for v in remote_collection.get_published_versions()[::-1]:
-        if v.doi is not None:
-            continue
+        if v.doi is None:
+            pending.setdefault(v.concept_id, []).append(v)
+
+    def backup_concept(versions: List[Record]):
+        backed_up: List[str] = []
+        errors: List[Exception] = []
+        for v in versions:
+            try:
+                backup_published_version(v)
+            except SkipForNow as e:
+                logger.warning("{}\n{}", e, traceback.format_exc())
+            except Exception as e:
+                errors.append(e)
+                logger.error("{}\n{}", e, traceback.format_exc())
+            else:
+                backed_up.append(v.id)
+
+        return backed_up, errors
 
-        try:
-            backup_published_version(v)
-        except SkipForNow as e:
-            logger.warning("{}\n{}", e, traceback.format_exc())
-        except Exception as e:
-            error = e
-            logger.error("{}\n{}", e, traceback.format_exc())
-        else:
-            backed_up.append(f"{v.id}/{v.version}")
+    backed_up: List[str] = []
+    error = None
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        for concept_backed_up, concept_errors in executor.map(
+            backup_concept, pending.values()
+        ):
+            backed_up.extend(concept_backed_up)
+            if concept_errors:
+                error = concept_errors[-1]
 
     logger.info("backed up {}", backed_up)
     if error is not None:
         raise error
 
+    return backed_up
+
 
 def backup_published_version(
     v: Record,
 ):
     with ValidationContext(perform_io_checks=False):
         rdf = load_description(v.rdf_url)
-        rdf_file_name = download(v.rdf_url).original_file_name
+
+    # no need to download the rdf (again) just for its file name
+    rdf_file_name = PurePosixPath(v.rdf_path).name
 
     if isinstance(rdf, InvalidDescr):
         raise Exception(
@@ -79,6 +111,14 @@ def backup_published_version(
     if rdf.license is None:
         raise ValueError(f"Missing license for {v.id}")
 
+    # prepare metadata before creating the deposition and uploading any files,
+    # so that failures here do not waste an upload
+    metadata = rdf_to_zenodo_metadata(
+        rdf,
+        rdf_file_name=rdf_file_name,
+        publication_date=v.info.created,
+    )
+
     headers = {"Content-Type": "application/json"}
     access_token = settings.zenodo_api_access_token.get_secret_value()
     assert len(access_token) > 1, "missing zenodo api access token"
@@ -86,7 +126,7 @@ def backup_published_version(
 
     if v.concept.doi is None:
         # Create empty deposition
-        r_create = requests.post(
+        r_create = get_session().post(
             f"{settings.zenodo_url}/api/deposit/depositions",
             params=params,
             json={},
@@ -95,7 +135,7 @@ def backup_published_version(
     else:
         concept_id = v.concept.doi.split("/zenodo.")[1]
         # create a new deposition version with different deposition_id from the existing deposition
-        r_create = requests.post(
+        r_create = get_session().post(
             settings.zenodo_url
             + "/api/deposit/depositions/"
             + concept_id
@@ -114,12 +154,14 @@ def backup_published_version(
     # # Extract nes deposition_id from url
     # deposition_id = newversion_draft_url.split('/')[-1]
 
-    # PUT files to the deposition
-    for file_path in v.get_file_paths():
-        file_data = v.client.load_file(file_path)
-        assert file_data is not None
-        filename = PurePosixPath(file_path).name
-        put_file(BytesIO(file_data), f"{bucket_url}/{filename}", params)
+    # PUT files to the deposition (streamed from S3, a few at a time)
+    def upload(file_path: str) -> None:
+        put_file_from_url(v.client.get_file_url(file_path), bucket_url, params)
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        futures = [executor.submit(upload, fp) for fp in v.get_file_paths()]
+        for future in as_completed(futures):
+            future.result()  # abort the backup if any upload failed
 
     # Report deposition URL
     deposition_id = str(deposition_info["id"])
@@ -130,15 +172,9 @@ def backup_published_version(
 
     # base_url = f"{settings.zenodo_url}/record/{concept_id}/files/"
 
-    metadata = rdf_to_zenodo_metadata(
-        rdf,
-        rdf_file_name=rdf_file_name,
-        publication_date=v.info.created,
-    )
-
     put_url = f"{settings.zenodo_url}/api/deposit/depositions/{deposition_id}"
     logger.debug("PUT {} with metadata: {}", put_url, metadata)
-    r_metadata = requests.put(
+    r_metadata = get_session().put(
         put_url,
         params=params,
         json={"metadata": metadata},
@@ -150,7 +186,7 @@ def backup_published_version(
         f"{settings.zenodo_url}/api/deposit/depositions/{deposition_id}/actions/publish"
     )
     logger.debug("POST {}", publish_url)
-    r_publish = requests.post(
+    r_publish = get_session().post(
         publish_url,
         params=params,
     )
@@ -179,6 +215,7 @@ def rdf_to_zenodo_metadata(
     publication_date: datetime,
     rdf_file_name: str,
 ) -> Dict[str, Any]:
+    import markdown
 
     creators = rdf_authors_to_metadata_creators(rdf)
     docstring = ""
@@ -207,7 +244,7 @@ def rdf_to_zenodo_metadata(
 
     if rdf.license is not None:
         # check if license id is valid:
-        license_response = requests.get(
+        license_response = get_session().get(
             f"https://zenodo.org/api/vocabularies/licenses/{rdf.license.lower()}"
         )
         try:
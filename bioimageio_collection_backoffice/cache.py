@@ -1,4 +1,5 @@
 import collections.abc
+import threading
 from functools import wraps
 from typing import (
     Callable,
@@ -25,11 +26,15 @@ class CacheInfo(NamedTuple):
 
 
 class UpdatetableLRU(Generic[Unpack[Ks], V]):
-    "LRU Cache that allows to pop and update cache entries."
+    """LRU Cache that allows to pop and update cache entries.
+
+    The cache may be shared between threads.
+    """
 
     def __init__(self, maxsize: int = 128):
         super().__init__()
         self._cache: OrderedDict[Tuple[Unpack[Ks]], V] = collections.OrderedDict()
+        self._lock = threading.RLock()
         self.maxsize = maxsize
         self._hits = 0
         self._misses = 0
@@ -37,13 +42,16 @@ class UpdatetableLRU(Generic[Unpack[Ks], V]):
     def __call__(self, func: Callable[[Unpack[Ks]], V]):
         @wraps(func)
         def wrapper(*args: Unpack[Ks]):
-            if args in self._cache:
-                self._cache.move_to_end(args)
-                return self._cache[args]
+            with self._lock:
+                if args in self._cache:
+                    self._cache.move_to_end(args)
+                    return self._cache[args]
 
             result = func(*args)
-            self._cache[args] = result
-            self._pop_for_size()
+            with self._lock:
+                self._cache[args] = result
+                self._pop_for_size()
+
             return result
 
         return wrapper
@@ -67,17 +75,25 @@ class UpdatetableLRU(Generic[Unpack[Ks], V]):
         keep_order: bool = False,
     ):
         """update cache (also counts as 'recently used', unless `keep_order is True`)"""
-        if only_if_cached and key not in self._cache:
-            return
+        with self._lock:
+            if only_if_cached and key not in self._cache:
+                return
 
-        self._cache[key] = value
-        if not keep_order:
-            self._cache.move_to_end(key)
+            self._cache[key] = value
+            if not keep_order:
+                self._cache.move_to_end(key)
 
-        self._pop_for_size()
+            self._pop_for_size()
 
     def pop(self, key: Tuple[Unpack[Ks]]):
-        _ = self._cache.pop(key, None)
+        with self._lock:
+            _ = self._cache.pop(key, None)
+
+    def pop_where(self, predicate: Callable[[Tuple[Unpack[Ks]]], bool]):
+        """pop all cache entries whose key satisfies `predicate`"""
+        with self._lock:
+            for key in [k for k in self._cache if predicate(k)]:
+                _ = self._cache.pop(key)
 
 
 V_Sized = TypeVar("V_Sized", bound=Optional[Sized])
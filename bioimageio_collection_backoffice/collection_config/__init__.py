@@ -1,15 +1,13 @@
-import json
-from functools import lru_cache
+from functools import cached_property, lru_cache
 from pathlib import Path
-
-import requests
+from typing import FrozenSet, Mapping
 
 from .._settings import settings
 from ..common import Node
-from ..requests_utils import raise_for_status_discretely
+from ..requests_utils import get_with_etag_cache
 from .collection_json_template import CollectionJsonTemplate
 from .id_parts import IdParts
-from .reviewers import Reviewers
+from .reviewers import Reviewer, Reviewers
 
 
 class CollectionConfig(Node, frozen=True):
@@ -21,15 +19,20 @@ class CollectionConfig(Node, frozen=True):
     def partners(self):
         return self.collection_template.config.partners
 
+    @cached_property
+    def reviewers_by_id(self) -> Mapping[str, Reviewer]:
+        return {r.id: r for r in self.reviewers}
+
+    @cached_property
+    def reviewer_emails(self) -> FrozenSet[str]:
+        return frozenset(r.email for r in self.reviewers)
+
     @classmethod
     @lru_cache
     def load(cls):
         if settings.collection_config.startswith("http"):
-            r = requests.get(settings.collection_config)
-            raise_for_status_discretely(r)
-            data = r.json()
+            data = get_with_etag_cache(settings.collection_config)
         else:
-            with Path(settings.collection_config).open(encoding="utf-8") as f:
-                data = json.load(f)
+            data = Path(settings.collection_config).read_bytes()
 
-        return cls.model_validate(data)
+        return cls.model_validate_json(data)
@@ -12,6 +12,7 @@ from .collection_config.collection_json_template import (
 )
 from .common import Node
 from .db_structure.version_info import DraftStatus, ErrorStatus
+from .id_map import IdInfo
 
 
 class Author(Node, frozen=True):
@@ -113,6 +114,19 @@ class ConceptSummary(Node, frozen=True):
         return self.versions[0].created > other.versions[0].created
 
 
+class ConceptEntries(Node, frozen=True):
+    """collection entries (and related summaries) of a single resource concept
+    (cached to skip regenerating them for unchanged concepts)"""
+
+    fingerprint: str
+    """fingerprint of the remote files these entries were generated from"""
+
+    entries: Sequence[CollectionEntry]
+    id_map: Mapping[str, IdInfo]
+    summary: Optional[ConceptSummary]
+    n_versions: int
+
+
 class AllVersions(Node, frozen=True):
     entries: Sequence[ConceptSummary]
 
@@ -13,7 +13,7 @@ from ..common import Node
 class Message(Node, frozen=True):
     author: str
     text: str
-    timestamp: datetime = datetime.now()
+    timestamp: datetime = Field(default_factory=datetime.now)
 
 
 class Chat(Node, frozen=True):
@@ -18,7 +18,7 @@ class CompatibilityReport(Node, frozen=True, extra="allow"):
     @property
     def tool_wo_version(self) -> str:
         """assuming a pattern of <tool>_"""
-        return self.tool.split("_")[0]
+        return self.tool.partition("_")[0]
 
     status: Literal["passed", "failed", "not-applicable"]
     """status of this tool for this resource"""
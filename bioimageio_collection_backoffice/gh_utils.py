@@ -1,12 +1,12 @@
-import json
 import uuid
 from functools import cache
-from io import TextIOWrapper
-from typing import Any, Dict, Literal, Optional, Union, no_type_check
+from typing import Any, Dict, List, Literal, Optional, Union, no_type_check
 
 import github
 from bioimageio.spec.summary import ValidationSummary
 from loguru import logger
+from pydantic import BaseModel, JsonValue
+from pydantic_core import to_json
 from rich.console import Console
 from rich.markdown import Markdown
 
@@ -27,11 +27,6 @@ def get_collection_repo():
     return get_gh_api().get_repo("bioimage-io/collection")
 
 
-def _set_gh_actions_output_impl(msg: Union[str, uuid.UUID], fh: TextIOWrapper):
-    logger.info("GH actions output: {}", msg)
-    print(msg, file=fh)
-
-
 def render_summary(summary: ValidationSummary, mode: Literal["w", "a"] = "w"):
     global rich_console
     summary_formatted = summary.format()
@@ -54,27 +49,45 @@ def render_summary(summary: ValidationSummary, mode: Literal["w", "a"] = "w"):
         )
 
 
+def _sort_keys(obj: JsonValue) -> JsonValue:
+    """recursively sort the keys of (nested) dictionaries"""
+    if isinstance(obj, dict):
+        return {k: _sort_keys(v) for k, v in sorted(obj.items())}
+    elif isinstance(obj, list):
+        return [_sort_keys(v) for v in obj]
+    else:
+        return obj
+
+
 def set_gh_actions_outputs(**outputs: Union[str, Any]):
+    """set output of a github actions workflow step calling this script"""
+    lines: List[str] = []
     for name, output in outputs.items():
-        """set output of a github actions workflow step calling this script"""
         if isinstance(output, bool):
             output = "yes" if output else "no"
 
+        if isinstance(output, BaseModel):
+            output = output.model_dump(mode="json")
+
         if not isinstance(output, str):
-            output = json.dumps(output, sort_keys=True)
-
-        if settings.github_output is None:
-            logger.error("output would be: {}", output)
-            return
-
-        with open(settings.github_output, "a") as fh:
-            if "\n" in output:
-                delimiter = uuid.uuid1()
-                _set_gh_actions_output_impl(f"{name}<<{delimiter}", fh)
-                _set_gh_actions_output_impl(output, fh)
-                _set_gh_actions_output_impl(delimiter, fh)
-            else:
-                _set_gh_actions_output_impl(f"{name}={output}", fh)
+            # sort keys for a stable output (as with `json.dumps(..., sort_keys=True)`)
+            output = to_json(_sort_keys(output)).decode()
+
+        if "\n" in output:
+            delimiter = uuid.uuid1()
+            lines.extend([f"{name}<<{delimiter}", output, str(delimiter)])
+        else:
+            lines.append(f"{name}={output}")
+
+    for line in lines:
+        logger.info("GH actions output: {}", line)
+
+    if settings.github_output is None:
+        logger.error("outputs would be: {}", outputs)
+        return
+
+    with open(settings.github_output, "a", encoding="utf-8") as fh:
+        _ = fh.write("".join(f"{line}\n" for line in lines))
 
 
 @no_type_check
@@ -4,13 +4,13 @@ import imaplib
 from contextlib import contextmanager
 from datetime import datetime, timedelta
 from email.utils import parsedate_to_datetime
-from typing import Any
+from typing import Any, Dict, List, Tuple, Union
 
 from loguru import logger
 
 from .._settings import settings
 from ..db_structure.chat import Chat, Message
-from ..remote_collection import get_remote_resource_version
+from ..remote_collection import Record, RecordDraft, get_remote_resource_version
 from ..s3_client import Client
 from .constants import (
     BOT_EMAIL,
@@ -68,6 +68,9 @@ def _update_chats(
     s3_client: Client, imap_client: imaplib.IMAP4_SSL, cutoff_datetime: datetime
 ):
     _ = imap_client.select("inbox")
+    # collect messages per resource version to update each chat only once
+    chats: Dict[Tuple[str, str], Tuple[Union[Record, RecordDraft], List[Message]]] = {}
+    msg_ids: Dict[Tuple[str, str], List[int]] = {}
     for msg_id, rid, rv, msg, dt in _iterate_relevant_emails(
         imap_client, cutoff_datetime
     ):
@@ -93,13 +96,23 @@ def _update_chats(
         text = "[forwarded from email]\n" + body.replace("> " + REPLY_HINT, "").replace(
             REPLY_HINT, ""
         )
-        rr = get_remote_resource_version(s3_client, rid, rv)
-        if not rr.exists():
-            logger.error("Cannot comment on non-existing resource {} {}", rid, rv)
-            continue
-
-        rr.extend_chat(Chat(messages=[Message(author=sender, text=text, timestamp=dt)]))
-        _ = imap_client.store(str(msg_id), "+FLAGS", FORWARDED_TO_CHAT_FLAT)
+        key = (rid, rv)
+        if key not in chats:
+            rr = get_remote_resource_version(s3_client, rid, rv)
+            if not rr.exists():
+                logger.error("Cannot comment on non-existing resource {} {}", rid, rv)
+                continue
+
+            chats[key] = (rr, [])
+            msg_ids[key] = []
+
+        chats[key][1].append(Message(author=sender, text=text, timestamp=dt))
+        msg_ids[key].append(msg_id)
+
+    for key, (rr, messages) in chats.items():
+        rr.extend_chat(Chat(messages=messages))
+        for msg_id in msg_ids[key]:
+            _ = imap_client.store(str(msg_id), "+FLAGS", FORWARDED_TO_CHAT_FLAT)
 
 
 def _iterate_relevant_emails(imap_client: imaplib.IMAP4_SSL, cutoff_datetime: datetime):
@@ -1,11 +1,16 @@
+import atexit
 import smtplib
+import threading
+import uuid
+from datetime import datetime
 from email.mime.text import MIMEText
-from typing import List, Union
+from typing import List, Optional, Sequence, Tuple, Union
 
 import markdown
 from loguru import logger
 
 from .._settings import settings
+from ..common import Node
 from ..mailroom.constants import (
     BOT_EMAIL,
     REPLY_HINT,
@@ -14,17 +19,29 @@ from ..mailroom.constants import (
     STATUS_UPDATE_SUBJECT,
 )
 from ..remote_collection import Record, RecordDraft
+from ..s3_client import Client
 
+OUTBOX = ".mailroom/outbox/"
+"""S3 (sub)prefix of queued emails (see `enqueue_notify_uploader`)"""
 
-def notify_uploader(rv: Union[RecordDraft, Record], subject_end: str, msg: str):
+
+class QueuedEmail(Node, frozen=True):
+    subject: str
+    body: str
+    recipients: List[str]
+
+
+def _create_uploader_email(
+    rv: Union[RecordDraft, Record], subject_end: str, msg: str
+) -> Optional[QueuedEmail]:
     uploader = rv.get_uploader()
 
     subject = f"{STATUS_UPDATE_SUBJECT}{rv.id} {rv.version} {subject_end.strip()}"
     if uploader.email == BOT_EMAIL:
         logger.info("skipping email '{}' to {}", subject, BOT_EMAIL)
-        return
+        return None
 
-    send_email(
+    return QueuedEmail(
         subject=subject,
         body=(
             f"Dear {uploader.name},\n"
@@ -39,19 +56,97 @@ def notify_uploader(rv: Union[RecordDraft, Record], subject_end: str, msg: str):
     )
 
 
-def send_email(subject: str, body: str, recipients: List[str]):
-    from_addr = BOT_EMAIL
-    to_addr = ", ".join(recipients)
+def enqueue_notify_uploader(rv: Union[RecordDraft, Record], subject_end: str, msg: str):
+    """queue an email to the uploader of **rv** to be sent by `flush_outbox`
+    (keeps SMTP off the critical path)"""
+    email = _create_uploader_email(rv, subject_end, msg)
+    if email is None:
+        return
+
+    # prefix with a timestamp to send queued emails in order
+    path = f"{OUTBOX}{datetime.now():%Y%m%dT%H%M%S%f}_{uuid.uuid4().hex[:8]}.json"
+    rv.client.put_pydantic(path, email)
+    logger.info("queued email '{}' as {}", email.subject, path)
+
+
+def flush_outbox(client: Client):
+    """send all queued emails (over one SMTP connection)
+
+    Emails that fail to send stay queued for the next flush.
+    """
+    error: Optional[Exception] = None
+    for path in sorted(client.ls_files(OUTBOX, suffix=".json")):
+        data = client.load_file(path)
+        if data is None:
+            continue
+
+        email = QueuedEmail.model_validate_json(data)
+        try:
+            send_email(email.subject, email.body, email.recipients)
+        except Exception as e:
+            logger.error("failed to send queued email {}: {}", path, e)
+            error = e
+        else:
+            client.rm(path)
+
+    if error is not None:
+        raise error
+
+
+_smtp_server: Optional[smtplib.SMTP_SSL] = None
+_smtp_lock = threading.Lock()
+
+
+def _get_smtp_server() -> smtplib.SMTP_SSL:
+    """get a connected and logged in SMTP server (reused across emails)"""
+    global _smtp_server
+    if _smtp_server is None:
+        _smtp_server = smtplib.SMTP_SSL(SMTP_SERVER, SMTP_PORT)
+        _ = _smtp_server.login(BOT_EMAIL, settings.mail_password.get_secret_value())
+
+    return _smtp_server
+
+
+def _close_smtp_server():
+    global _smtp_server
+    if _smtp_server is not None:
+        try:
+            _ = _smtp_server.quit()
+        except smtplib.SMTPException:
+            pass
+
+        _smtp_server = None
+
+
+_ = atexit.register(_close_smtp_server)
+
+
+def _create_message(subject: str, body: str, recipients: List[str]) -> MIMEText:
     body_html = markdown.markdown(body)
     msg = MIMEText(body_html, "html")
-    msg["From"] = from_addr
-    msg["To"] = to_addr
+    msg["From"] = BOT_EMAIL
+    msg["To"] = ", ".join(recipients)
     msg["Subject"] = subject
-    with smtplib.SMTP_SSL(SMTP_SERVER, SMTP_PORT) as smtp_server:
-        _ = smtp_server.login(BOT_EMAIL, settings.mail_password.get_secret_value())
-        _ = smtp_server.sendmail(BOT_EMAIL, recipients, msg.as_string())
+    return msg
+
+
+def send_email(subject: str, body: str, recipients: List[str]):
+    send_emails([(subject, body, recipients)])
+
+
+def send_emails(emails: Sequence[Tuple[str, str, List[str]]]):
+    """send several emails (subject, body, recipients) over one SMTP connection"""
+    with _smtp_lock:
+        for subject, body, recipients in emails:
+            msg = _create_message(subject, body, recipients).as_string()
+            try:
+                _ = _get_smtp_server().sendmail(BOT_EMAIL, recipients, msg)
+            except smtplib.SMTPServerDisconnected:
+                # reconnect once
+                _close_smtp_server()
+                _ = _get_smtp_server().sendmail(BOT_EMAIL, recipients, msg)
 
-    logger.info("Email '{}' sent to {}", subject, recipients)
+            logger.info("Email '{}' sent to {}", subject, recipients)
 
 
 if __name__ == "__main__":
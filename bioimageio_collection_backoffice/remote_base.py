@@ -1,7 +1,7 @@
 import traceback
 from abc import abstractmethod
-from dataclasses import dataclass
-from typing import Any, Optional, Type, TypeVar, Union
+from dataclasses import dataclass, field
+from typing import Any, Dict, Optional, Tuple, Type, TypeVar, Union
 
 from loguru import logger
 
@@ -11,6 +11,7 @@ from .db_structure.reserved import Reserved
 from .db_structure.version_info import DraftInfo, RecordInfo
 from .s3_client import Client
 
+JsonFile = Union[DraftInfo, RecordInfo, Log, Chat, Reserved]
 JsonFileT = TypeVar("JsonFileT", DraftInfo, RecordInfo, Log, Chat, Reserved)
 
 
@@ -19,6 +20,11 @@ class RemoteBase:
     client: Client
     """Client to connect to remote storage"""
 
+    _json_cache: Dict[str, Tuple[bytes, JsonFile]] = field(
+        default_factory=lambda: {}, init=False, repr=False, compare=False
+    )
+    """parsed json files by path (with the raw data they were parsed from)"""
+
     @property
     @abstractmethod
     def id(self) -> str: ...
@@ -28,18 +34,40 @@ class RemoteBase:
         """The S3 (sub)prefix of this resource"""
         return f"{self.id}/"
 
+    def refresh(self):
+        """drop cached remote files of this resource to force reloading them,
+        e.g. if another process may have updated them"""
+        self._json_cache.clear()
+        self.client.uncache(self.folder)
+
     def _get_json(self, typ: Type[JsonFileT]) -> JsonFileT:
         path = self.folder + typ.file_name
         data = self.client.load_file(path)
         if data is None:
             return typ()
-        else:
-            return typ.model_validate_json(data)
 
-    def _update_json(self, update: JsonFileT):
+        cached = self._json_cache.get(path)
+        # the client's cache returns the identical bytes object until the file
+        # is updated, so an identity check suffices to validate our cache entry
+        if cached is not None and cached[0] is data and isinstance(cached[1], typ):
+            return cached[1]
+
+        parsed = typ.model_validate_json(data)
+        self._json_cache[path] = (data, parsed)
+        return parsed
+
+    def _update_json(self, update: JsonFileT, current: Optional[JsonFileT] = None):
+        """update a json file
+
+        Args:
+            update: the update to apply
+            current: the current content (if already loaded)
+        """
         path = self.folder + update.file_name
         logger.info("Extending {} with {}", path, update)
-        current = self._get_json(update.__class__)
+        if current is None:
+            current = self._get_json(update.__class__)
+
         updated = current.get_updated(update)
         self.client.put_pydantic(path, updated)
 
@@ -1,13 +1,19 @@
 from __future__ import annotations
 
 import hashlib
+import importlib.metadata
+import inspect
 import io
 import json
 import random
+import shutil
+import sys
+import tempfile
 import urllib.request
 import zipfile
 from abc import ABC
-from collections import defaultdict
+from collections import Counter
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
 from dataclasses import dataclass, field
 from functools import wraps
 from itertools import product
@@ -17,19 +23,19 @@ from typing import (
     Callable,
     ClassVar,
     Dict,
+    Iterable,
     List,
     Literal,
     Mapping,
     Optional,
     Sequence,
+    Set,
     Tuple,
     TypeVar,
     Union,
 )
 from urllib.parse import SplitResult, urlsplit, urlunsplit
 
-import bioimageio.core
-import requests
 from bioimageio.spec import ValidationContext
 from bioimageio.spec.common import HttpUrl
 from bioimageio.spec.utils import (
@@ -38,7 +44,7 @@ from bioimageio.spec.utils import (
 )
 from loguru import logger
 from pydantic import AnyUrl
-from ruyaml import YAML
+from pydantic_core import from_json
 from typing_extensions import Concatenate, ParamSpec, assert_never
 
 from bioimageio_collection_backoffice.gh_utils import set_gh_actions_outputs
@@ -52,10 +58,12 @@ from .collection_json import (
     CollectionEntry,
     CollectionJson,
     CollectionWebsiteConfig,
+    ConceptEntries,
     ConceptSummary,
     ConceptVersion,
     Uploader,
 )
+from .common import yaml
 from .db_structure.chat import Chat, Message
 from .db_structure.compatibility import (
     CompatibilityReport,
@@ -80,10 +88,9 @@ from .db_structure.version_info import (
 from .id_map import IdInfo, IdMap
 from .mailroom.constants import BOT_EMAIL
 from .remote_base import RemoteBase
+from .requests_utils import get_session
 from .s3_client import Client
 
-yaml = YAML(typ="safe")
-
 LEGACY_DOWNLOAD_COUNTS = {
     "affable-shark": 70601,
     "ambitious-ant": 5830,
@@ -131,6 +138,12 @@ LEGACY_DOWNLOAD_COUNTS = {
     "willing-hedgehog": 37772,
 }
 
+BIOIMAGEIO_CORE_VERSION = importlib.metadata.version("bioimageio.core")
+"""installed bioimageio.core version (looked up without importing bioimageio.core)"""
+
+BACKOFFICE_VERSION = importlib.metadata.version("bioimageio-collection-backoffice")
+"""installed version of this package"""
+
 LEGACY_VERSIONS = {
     "10.5281/zenodo.5764892": ["6647674", "6322939"],
     "10.5281/zenodo.6338614": ["6338615"],
@@ -219,7 +232,7 @@ def reviewer_role(
 
     @wraps(func)
     def wrapper(self: R, actor: str, *args: P.args, **kwargs: P.kwargs):
-        if not any(r.id == actor for r in self.collection.config.reviewers):
+        if actor not in self.collection.config.reviewers_by_id:
             raise ValueError(f"{actor} is not allowed to trigger '{func.__name__}'")
 
         return func(self, actor, *args, **kwargs)
@@ -237,7 +250,7 @@ def lock_concept(
         concept_id = self.concept_id
         assert not concept_id.endswith("/"), concept_id
         lock_path = f"{concept_id}/concept-lock"
-        if list(self.client.ls(lock_path)):
+        if any(self.client.ls(lock_path)):
             raise ValueError(f"{concept_id} is currently locked")
 
         self.client.put(lock_path, io.BytesIO(b" "), length=1)
@@ -259,7 +272,7 @@ def lock_version(
         concept_id = self.concept_id
         version = self.version
         lock_path = f"{concept_id}/{version}/version-lock"
-        if list(self.client.ls(lock_path)):
+        if any(self.client.ls(lock_path)):
             raise ValueError(f"{concept_id} is currently locked")
 
         self.client.put(lock_path, io.BytesIO(b" "), length=1)
@@ -309,6 +322,18 @@ class RemoteCollection(RemoteBase):
             if not d.startswith(".")
         ]
 
+    def _scan_concepts(
+        self, path: str = "", *, salt: str
+    ) -> Tuple[Dict[str, Set[str]], Dict[str, str]]:
+        """Find all versions of all concepts (under `path`) and fingerprint
+        each concept's files with a single recursive listing
+        (see `scan_concept_files`)"""
+        return scan_concept_files(
+            self.client.ls_files_with_etag(path),
+            partner_ids=self.partner_ids,
+            salt=salt,
+        )
+
     def _select_parts(self, type_: str):
         if type_ == "model":
             return self.config.id_parts.model
@@ -360,9 +385,15 @@ class RemoteCollection(RemoteBase):
     def generate_collection_json(
         self,
         mode: Literal["published", "draft"] = "published",
+        full_rebuild: bool = False,
     ) -> None:
         """generate a json file with an overview of all published resources
         (also generates `versions.json` files for each research concept)
+
+        Args:
+            mode: generate the collection of published or draft resources
+            full_rebuild: regenerate the entries of all concepts,
+                not only of those that changed since the last run
         """
         collection_output_file_name: str = (
             "collection.json" if mode == "published" else f"collection_{mode}.json"
@@ -386,52 +417,112 @@ class RemoteCollection(RemoteBase):
             id_map_file_name,
         )
 
-        collection_entries: List[CollectionEntry] = []
-        concepts_summaries: List[ConceptSummary] = []
-        n_resource_versions: Dict[str, int] = defaultdict(lambda: 0)
-        n_resources: Dict[str, int] = defaultdict(lambda: 0)
-        error_in_published_entry = None
-        id_map: Dict[str, IdInfo] = {}
-        for rc in self.get_concepts():
+        salt = get_concept_entries_salt(self.config)
+        concept_versions, fingerprints = self._scan_concepts(salt=salt)
+
+        def create_concept_entries(
+            rc: RecordConcept,
+        ) -> Union[ConceptEntries, Exception, None]:
+            """create collection entries of a single concept
+            (executed concurrently for all concepts)"""
+            known_versions = concept_versions[rc.id]
+            if mode == "draft":
+                if "draft" not in known_versions:
+                    return None
+            elif not known_versions - {"draft"}:
+                return None
+
+            cache_path = f"{rc.folder}{CONCEPT_ENTRIES_PREFIX}{mode}.json"
+            fingerprint = fingerprints[rc.id]
+            if not full_rebuild and (
+                (cached_data := self.client.load_file(cache_path)) is not None
+            ):
+                try:
+                    cached = ConceptEntries.model_validate_json(cached_data)
+                except Exception as e:
+                    logger.warning("ignoring invalid {}: {}", cache_path, e)
+                else:
+                    if cached.fingerprint == fingerprint:
+                        return cached
+
             versions: Union[List[RecordDraft], List[Record]] = (
-                ([rc.draft] if rc.draft.exists() else [])
+                [rc.draft]
                 if mode == "draft"
-                else rc.get_published_versions()
+                else rc.get_published_versions(known_versions - {"draft"})
             )
             if not versions:
-                continue
+                return None
 
             try:
-                versions_in_collection, id_map_update = create_collection_entries(
-                    versions
-                )
+                entries, concept_id_map = create_collection_entries(versions)
+                if entries:
+                    latest_entry = entries[0]
+                    summary = ConceptSummary(
+                        concept=latest_entry.id,
+                        type=latest_entry.type,
+                        concept_doi=latest_entry.concept_doi,
+                        versions=sorted(
+                            ConceptVersion(
+                                v=v.version,
+                                created=v.info.created,
+                                doi=v.doi,
+                                source=concept_id_map[v.id].source,
+                                sha256=concept_id_map[v.id].sha256,
+                            )
+                            for v in versions
+                        ),
+                    )
+                else:
+                    summary = None
             except Exception as e:
-                error_in_published_entry = f"failed to create {rc.id} entry: {e}"
+                return e
+
+            # fingerprint the concept's files as left behind by
+            # `create_collection_entries` (incl. its generated files)
+            fingerprint = self._scan_concepts(rc.folder, salt=salt)[1].get(
+                rc.id, fingerprint
+            )
+            result = ConceptEntries(
+                fingerprint=fingerprint,
+                entries=entries,
+                id_map=concept_id_map,
+                summary=summary,
+                n_versions=len(versions),
+            )
+            self.client.put_pydantic(cache_path, result)
+            return result
+
+        with ThreadPoolExecutor(max_workers=self.client.max_workers) as executor:
+            concepts = [
+                RecordConcept(client=self.client, concept_id=concept_id)
+                for concept_id in sorted(concept_versions)
+            ]
+            concept_results = list(executor.map(create_concept_entries, concepts))
+
+        collection_entries: List[CollectionEntry] = []
+        concepts_summaries: List[ConceptSummary] = []
+        n_resource_versions: Counter[str] = Counter()
+        n_resources: Counter[str] = Counter()
+        types = ("model", "dataset", "notebook")
+        taken_ids: Dict[str, Set[str]] = {typ: set() for typ in types}
+        error_in_published_entry = None
+        id_map: Dict[str, IdInfo] = {}
+        for rc, result in zip(concepts, concept_results):
+            if result is None:
+                continue
+            elif isinstance(result, Exception):
+                error_in_published_entry = f"failed to create {rc.id} entry: {result}"
                 logger.error(error_in_published_entry)
             else:
-                id_map.update(id_map_update)
-                if versions_in_collection:
-                    latest_version = versions_in_collection[0]
-                    n_resources[latest_version.type] += 1
-                    n_resource_versions[latest_version.type] += len(versions)
-                    collection_entries.extend(versions_in_collection)
-                    concepts_summaries.append(
-                        ConceptSummary(
-                            concept=latest_version.id,
-                            type=latest_version.type,
-                            concept_doi=latest_version.concept_doi,
-                            versions=sorted(
-                                ConceptVersion(
-                                    v=v.version,
-                                    created=v.info.created,
-                                    doi=v.doi,
-                                    source=id_map[v.id].source,
-                                    sha256=id_map[v.id].sha256,
-                                )
-                                for v in versions
-                            ),
-                        )
-                    )
+                id_map.update(result.id_map)
+                if result.entries:
+                    latest_entry = result.entries[0]
+                    n_resources[latest_entry.type] += 1
+                    n_resource_versions[latest_entry.type] += result.n_versions
+                    taken_ids.setdefault(latest_entry.type, set()).add(latest_entry.id)
+                    collection_entries.extend(result.entries)
+                    assert result.summary is not None
+                    concepts_summaries.append(result.summary)
 
         collection_entries.sort()
         concepts_summaries.sort()
@@ -465,11 +556,6 @@ class RemoteCollection(RemoteBase):
         )
 
         all_versions = AllVersions(entries=concepts_summaries)
-        types = ("model", "dataset", "notebook")
-        taken_ids = {
-            typ: {cs.concept for cs in concepts_summaries if cs.type == typ}
-            for typ in types
-        }
         available_concept_ids = AvailableConceptIds.model_validate(
             {
                 typ: [
@@ -490,12 +576,11 @@ class RemoteCollection(RemoteBase):
         # if not isinstance(coll_descr, CollectionDescr):
         #     raise ValueError(coll_descr.validation_summary.format())
 
-        if collection_entries or not list(self.client.ls(collection_output_file_name)):
-            self.client.put_json(
+        if collection_entries or not any(self.client.ls(collection_output_file_name)):
+            self.client.put_pydantic(
                 collection_output_file_name,
-                collection.model_dump(
-                    mode="json", exclude_defaults=mode == "published"
-                ),
+                collection,
+                exclude_defaults=mode == "published",
             )
         else:
             logger.error(
@@ -503,14 +588,18 @@ class RemoteCollection(RemoteBase):
                 collection_output_file_name,
             )
 
-        if all_versions or not list(self.client.ls(all_versions_file_name)):
-            self.client.put_json(
+        if all_versions or not any(self.client.ls(all_versions_file_name)):
+            self.client.put_pydantic(
                 all_versions_file_name,
-                all_versions.model_dump(mode="json", exclude_defaults=True),
+                all_versions,
+                exclude_defaults=True,
+                skip_unchanged=True,
             )
-            self.client.put_json(
+            self.client.put_pydantic(
                 available_concept_ids_file_name,
-                available_concept_ids.model_dump(mode="json", exclude_defaults=True),
+                available_concept_ids,
+                exclude_defaults=True,
+                skip_unchanged=True,
             )
         else:
             logger.error(
@@ -518,13 +607,14 @@ class RemoteCollection(RemoteBase):
                 all_versions_file_name,
             )
 
-        if id_map_file_name or not list(self.client.ls(id_map_file_name)):
+        if id_map_file_name or not any(self.client.ls(id_map_file_name)):
             self.client.put_json(
                 id_map_file_name,
                 {
                     k: ii.model_dump(mode="json", exclude_defaults=True)
                     for k, ii in id_map.items()
                 },
+                skip_unchanged=True,
             )
         else:
             logger.error(
@@ -539,17 +629,12 @@ class RemoteCollection(RemoteBase):
     def get_collection_json(self) -> CollectionJson:
         data = self.client.load_file("collection.json")
         assert data is not None
-        collection: Dict[str, List[Dict[str, Any]]] = json.loads(data)
-        assert isinstance(
-            collection, dict
-        )  # TODO: create typed dict for collection.json
-        assert all(isinstance(k, str) for k in collection)
-        assert "collection" in collection
-        assert isinstance(collection["collection"], list)
-        assert all(isinstance(e, dict) for e in collection["collection"])
-        assert all(isinstance(k, str) for e in collection["collection"] for k in e)
-        assert all("name" in e for e in collection["collection"])
-        return CollectionJson(**collection)  # type: ignore
+        # validate the raw bytes directly (pydantic-core's JSON parser)
+        return CollectionJson.model_validate_json(data)
+
+
+CONCEPT_ENTRIES_PREFIX = ".collection_entries_"
+"""file name prefix of the cached collection entries of a concept"""
 
 
 @dataclass
@@ -559,6 +644,9 @@ class RecordConcept(RemoteBase):
 
     collection: RemoteCollection = field(init=False)
     concept_id: str
+    _draft: Optional[RecordDraft] = field(
+        default=None, init=False, repr=False, compare=False
+    )
 
     @property
     def id(self):
@@ -569,17 +657,40 @@ class RecordConcept(RemoteBase):
 
     @property
     def draft(self) -> RecordDraft:
-        return RecordDraft(client=self.client, concept_id=self.id)
+        # reuse the draft (and its loaded json files) of this concept
+        if self._draft is None:
+            self._draft = RecordDraft(client=self.client, concept_id=self.id)
+            self._draft.concept = self
+
+        return self._draft
+
+    def get_published_versions(
+        self, existing_versions: Optional[Iterable[str]] = None
+    ) -> List[Record]:
+        """Get representations of the published version
+
+        Args:
+            existing_versions: Versions already known to exist
+                (skips listing and checking the concept folder).
+        """
+        if existing_versions is None:
+            # find all versions with a single recursive listing of rdf.yaml files
+            rdf_suffix = "/files/rdf.yaml"
+            existing_versions = [
+                version
+                for p in self.client.ls_files(self.folder, suffix=rdf_suffix)
+                if (version := p[len(self.folder) : -len(rdf_suffix)])
+                and "/" not in version
+                and version != "draft"
+            ]
+            # load the info of all versions at once (to sort them by creation date)
+            self.client.prefetch(
+                f"{self.folder}{v}/{RecordInfo.file_name}" for v in existing_versions
+            )
 
-    def get_published_versions(self) -> List[Record]:
-        """Get representations of the published version"""
         versions = [
-            rec
-            for v in self.client.ls(self.folder, only_folders=True)
-            if (version := v.strip("/")) != "draft"
-            and (
-                rec := Record(client=self.client, concept_id=self.id, version=version)
-            ).exists()
+            Record(client=self.client, concept_id=self.id, version=v)
+            for v in existing_versions
         ]
         versions.sort(key=lambda r: r.info.created, reverse=True)
         return versions
@@ -612,7 +723,7 @@ class RecordBase(RemoteBase, ABC):
         return self.concept.collection
 
     def exists(self):
-        return bool(list(self.client.ls(self.rdf_path, only_files=True)))
+        return any(self.client.ls(self.rdf_path, only_files=True))
 
     @property
     def rdf_path(self) -> str:
@@ -623,7 +734,7 @@ class RecordBase(RemoteBase, ABC):
         if rdf_data is None:
             return {}
         else:
-            return yaml.load(rdf_data.decode())
+            return yaml.load(rdf_data)
 
     @property
     def rdf_url(self) -> str:
@@ -669,17 +780,22 @@ class RecordBase(RemoteBase, ABC):
 
     def get_all_compatibility_reports(self, tool: Optional[str] = None):
         """get all compatibility reports"""
-        tools = [
-            d[:-5]
-            for d in self.client.ls(f"{self.folder}compatibility/", only_files=True)
-            if d.endswith(".json") and (tool is None or d[:-5] == tool)
-        ]
+        if tool is None:
+            tools = [
+                d[:-5]
+                for d in self.client.ls(f"{self.folder}compatibility/", only_files=True)
+                if d.endswith(".json")
+            ]
+        else:
+            # no need to list all reports to load a single one
+            tools = [tool]
+
         reports_data = {
             t: self.client.load_file(self.get_compatibility_report_path(t))
             for t in tools
         }
         return [
-            CompatibilityReport.model_validate({**json.loads(d), "tool": t})
+            CompatibilityReport.model_validate({**from_json(d), "tool": t})
             for t, d in reports_data.items()
             if d is not None
         ]
@@ -769,8 +885,19 @@ class RecordDraft(RecordBase):
 
         collection_data = self.client.load_file("collection.json")
         assert collection_data is not None
-        collection = json.loads(collection_data)
-        for e in collection["collection"]:
+        # only parse the (large) collection.json if the name occurs in it at all
+        name_json = [
+            json.dumps(rdf["name"], ensure_ascii=ensure_ascii).encode()
+            for ensure_ascii in (True, False)
+        ]
+        if any(n in collection_data for n in name_json):
+            collection_entries: List[Dict[str, Any]] = from_json(collection_data)[
+                "collection"
+            ]
+        else:
+            collection_entries = []
+
+        for e in collection_entries:
             if e["name"] == rdf["name"]:
                 if e["id"] != rdf["id"]:
                     self.add_log_entry(
@@ -790,7 +917,11 @@ class RecordDraft(RecordBase):
         if not str(rdf["id"]):
             raise ValueError(f"Invalid `id`: {rdf['id']}")
 
-        reviewers = {r.id: r for r in self.collection.config.reviewers}
+        reviewer = (
+            None
+            if settings.bioimageio_user_id is None
+            else self.collection.config.reviewers_by_id.get(settings.bioimageio_user_id)
+        )
         if "uploader" in rdf:
             given_uploader_email: Any = (
                 None
@@ -800,9 +931,9 @@ class RecordDraft(RecordBase):
             if not isinstance(given_uploader_email, str) or not given_uploader_email:
                 raise ValueError("RDF is missing `uploader.email` field.")
 
-            if settings.bioimageio_user_id not in reviewers:
+            if reviewer is None:
                 # verify that uploader email matches bioimageio id
-                req = requests.get(
+                req = get_session().get(
                     f"https://api.github.com/search/users?q={given_uploader_email}+in:email"
                 )
                 req.raise_for_status()
@@ -822,13 +953,13 @@ class RecordDraft(RecordBase):
                         + f" '{given_uploader_email}' specified in `uploader.email`."
                     )
 
-        elif settings.bioimageio_user_id in reviewers:
-            rdf["uploader"] = dict(
-                name=reviewers[settings.bioimageio_user_id].name,
-                email=reviewers[settings.bioimageio_user_id].email,
-            )
+        elif reviewer is not None:
+            rdf["uploader"] = dict(name=reviewer.name, email=reviewer.email)
         else:
-            raise ValueError("RDF is missing `uploader.email` field.")
+            raise ValueError(
+                "RDF is missing `uploader.email` field"
+                + f" (required as '{settings.bioimageio_user_id}' is not a reviewer)."
+            )
 
         uploader: Any = rdf["uploader"]["email"]
         if previous_rdf is not None:
@@ -841,7 +972,7 @@ class RecordDraft(RecordBase):
             if (
                 uploader != previous_rdf.get("uploader", {}).get("email", BOT_EMAIL)
                 and uploader not in maintainer_emails
-                and uploader not in [r.email for r in self.collection.config.reviewers]
+                and uploader not in self.collection.config.reviewer_emails
             ):
                 raise ValueError(
                     f"uploader '{uploader}' is not a maintainer of '{self.id}'"
@@ -851,10 +982,22 @@ class RecordDraft(RecordBase):
         # clean up any previous draft files
         self.client.rm_dir(self.folder + "files/")
 
-        # upload new draft files
+        # collect generated files first, so that all uploads run inside the pool's
+        # lifetime below
+        generated_files: Dict[str, bytes] = {}
+
         def upload(file_name: str, file_data: bytes):
-            path = f"{self.folder}files/{file_name}"
-            self.client.put(path, io.BytesIO(file_data), length=len(file_data))
+            generated_files[file_name] = file_data
+
+        def upload_from_zip(file_name: str):
+            # note: reading members of the same zip file from multiple threads
+            #       is safe; the underlying file access is guarded by a lock
+            info = package_zip.getinfo(file_name)
+            with package_zip.open(info) as f:
+                # stream the (decompressed) member instead of reading it first
+                self.client.put(
+                    f"{self.folder}files/{file_name}", f, length=info.file_size
+                )
 
         thumbnails = create_thumbnails(rdf, package_zip)
         config = rdf.setdefault("config", {})
@@ -863,7 +1006,7 @@ class RecordDraft(RecordBase):
             if isinstance(bioimageio_config, dict):
                 thumbnail_config: Any = bioimageio_config.setdefault("thumbnails", {})
                 if isinstance(thumbnail_config, dict):
-                    for oname, (tname, tdata) in thumbnails.items():
+                    for oname, tname, tdata in thumbnails:
                         upload(tname, tdata)
                         thumbnail_config[oname] = tname
 
@@ -884,9 +1027,27 @@ class RecordDraft(RecordBase):
             logger.warning("ignoring alternative rdf.yaml source '{other}'")
             file_names.remove(other)
 
-        for file_name in file_names:
-            file_data = package_zip.open(file_name).read()
-            upload(file_name, file_data)
+        # upload new draft files (concurrently)
+        with ThreadPoolExecutor(max_workers=self.client.max_workers) as executor:
+            uploads: List[Future[None]] = [
+                executor.submit(
+                    self.client.put,
+                    f"{self.folder}files/{file_name}",
+                    io.BytesIO(file_data),
+                    length=len(file_data),
+                )
+                for file_name, file_data in generated_files.items()
+            ]
+            uploads.extend(executor.submit(upload_from_zip, fn) for fn in file_names)
+            try:
+                for fut in as_completed(uploads):
+                    fut.result()  # raise any upload error
+            except BaseException:
+                # cancel the uploads that did not start yet
+                for fut in uploads:
+                    _ = fut.cancel()
+
+                raise
 
         self._set_status(UnpackedStatus())
 
@@ -900,10 +1061,8 @@ class RecordDraft(RecordBase):
     @reviewer_role
     def request_changes(self, reviewer: str, reason: str):
         # map reviewer id to name
-        for r in self.collection.config.reviewers:
-            if reviewer == r.id:
-                break
-        else:
+        r = self.collection.config.reviewers_by_id.get(reviewer)
+        if r is None:
             raise ValueError(reviewer)
 
         description = (
@@ -921,10 +1080,8 @@ class RecordDraft(RecordBase):
     def publish(self, reviewer: str) -> Record:
         """mark this staged version candidate as accepted and try to publish it"""
         # map reviewer id to name
-        for r in self.collection.config.reviewers:
-            if reviewer == r.id:
-                reviewer = r.name
-                break
+        if (r := self.collection.config.reviewers_by_id.get(reviewer)) is not None:
+            reviewer = r.name
 
         self._set_status(AcceptedStatus())
         self.extend_chat(
@@ -944,41 +1101,36 @@ class RecordDraft(RecordBase):
         if rdf_data is None:
             raise RuntimeError(f"Failed to load staged RDF from {self.rdf_path}")
 
-        rdf: Dict[Any, Any] = yaml.load(rdf_data.decode())
+        rdf: Dict[Any, Any] = yaml.load(rdf_data)
         assert isinstance(rdf, dict)
         version = rdf.get("version", "1")
         if not isinstance(version, (int, float, str)):
             raise ValueError(f"Invalid `version`: '{version}'")
         else:
             version = str(version)
-            if version in {v.version for v in self.concept.get_published_versions()}:
-                raise ValueError(f"Trying to publish version '{version}' again!")
+
+        published = Record(
+            client=self.client, concept_id=self.concept_id, version=version
+        )
+        if published.exists():
+            raise ValueError(f"Trying to publish version '{version}' again!")
 
         # remember previously published concept doi
-        if previous_versions := self.concept.get_published_versions():
+        previous_versions = self.concept.get_published_versions()
+        if previous_versions:
             concept_doi = previous_versions[0].info.concept_doi
         else:
             concept_doi = None
 
-        published = Record(
-            client=self.client, concept_id=self.concept_id, version=version
-        )
-
         # move all files
-        self.client.cp_dir(self.folder, published.folder)
-
-        # overwrite rdf.yaml with updated version_number
-        stream = io.StringIO()
-        yaml.dump(rdf, stream)
-        rdf_data = stream.getvalue().encode()
-        self.client.put(self.rdf_path, io.BytesIO(rdf_data), length=len(rdf_data))
-        self.client.rm_dir(self.folder)
+        self.client.mv_dir(self.folder, published.folder)
 
         published.update_info(RecordInfo(concept_doi=concept_doi))
         return published
 
     def _set_status(self, value: DraftStatus):
-        current_status = self.info.status
+        info = self.info
+        current_status = info.status
         self.add_log_entry(
             LogEntry(message=f"new status: {value.description}", details=value)
         )
@@ -987,7 +1139,7 @@ class RecordDraft(RecordBase):
         elif value.step < current_status.step:
             logger.warning("Proceeding from {} to {}", current_status, value)
 
-        self._update_json(DraftInfo(status=value))
+        self._update_json(DraftInfo(status=value), current=info)
 
 
 @dataclass
@@ -1036,9 +1188,9 @@ class Record(RecordBase):
 def load_rdf_from_package_zip(
     package_zip: zipfile.ZipFile, bioimageio_yaml_file_name: str
 ):
-    rdf: Dict[Any, Any] = yaml.load(
-        package_zip.open(bioimageio_yaml_file_name).read().decode()
-    )
+    with package_zip.open(bioimageio_yaml_file_name) as f:
+        rdf: Dict[Any, Any] = yaml.load(f)
+
     if not isinstance(rdf, dict):
         raise ValueError(f"Expected {bioimageio_yaml_file_name} to hold a dictionary")
     return rdf
@@ -1051,8 +1203,13 @@ def load_from_package_url(package_url: str):
     except Exception as e:
         raise RuntimeError(f"failed to open {package_url}: {e}")
 
-    zipinmemory = io.BytesIO(remotezip.read())
-    return zipfile.ZipFile(zipinmemory)
+    # spool the package to a temporary file instead of holding it in memory
+    package_file = tempfile.TemporaryFile()
+    with remotezip:
+        shutil.copyfileobj(remotezip, package_file, length=1 << 20)
+
+    _ = package_file.seek(0)
+    return zipfile.ZipFile(package_file)
 
 
 def draft_new_version(
@@ -1064,6 +1221,7 @@ def draft_new_version(
         package_url: upload source
         concept_id: (optional) overwrite any resource id given in **package_url**
     """
+    package_zip: Optional[zipfile.ZipFile] = None
     if not concept_id:
         package_zip = load_from_package_url(package_url)
         bioimageio_yaml_file_name = identify_bioimageio_yaml_file_name(
@@ -1085,7 +1243,8 @@ def draft_new_version(
 
     set_gh_actions_outputs(concept_id=concept_id)
     draft = RecordDraft(collection.client, concept_id=concept_id)
-    draft.unpack(package_url=package_url)
+    # reuse the package if we already downloaded it
+    draft.unpack(package_url=package_url, package_zip=package_zip)
     return draft
 
 
@@ -1118,6 +1277,16 @@ def get_remote_resource_version(
 def maybe_swap_with_thumbnail(
     src: Union[Any, Dict[Any, Any], List[Any]], thumbnails: Mapping[str, str]
 ) -> Any:
+    if not thumbnails:
+        return src  # nothing to swap
+
+    if isinstance(src, str):
+        if src.startswith("https://"):
+            return src
+
+        clean_name = Path(src).name  # remove any leading './'
+        return thumbnails.get(clean_name, src)
+
     if isinstance(src, dict):
         src_dict: Dict[Any, Any] = src
         return {
@@ -1128,13 +1297,6 @@ def maybe_swap_with_thumbnail(
         src_list: List[Any] = src
         return [maybe_swap_with_thumbnail(s, thumbnails) for s in src_list]
 
-    if isinstance(src, str) and not src.startswith("https://"):
-        clean_name = Path(src).name  # remove any leading './'
-        if clean_name in thumbnails:
-            return thumbnails[clean_name]
-        else:
-            return src
-
     return src
 
 
@@ -1168,6 +1330,77 @@ def resolve_relative_path(
     return src
 
 
+def get_concept_entries_salt(config: CollectionConfig) -> str:
+    """hash of everything besides a concept's files that its (cached)
+    `ConceptEntries` and the files generated alongside them
+    (`versions.json`, `test_summary.yaml`) depend on"""
+    h = hashlib.sha256()
+    for part in (
+        BIOIMAGEIO_CORE_VERSION,
+        BACKOFFICE_VERSION,
+        # any code change in this module (which generates the entries) may
+        # change them, also if the package version is not bumped
+        inspect.getsource(sys.modules[__name__]),
+        *(
+            json.dumps(model.model_json_schema(), sort_keys=True)
+            for model in (ConceptEntries, VersionsInfo, TestSummary)
+        ),
+        config.model_dump_json(),
+    ):
+        h.update(part.encode())
+        h.update(b"\n")
+
+    return h.hexdigest()
+
+
+def scan_concept_files(
+    files: Iterable[Tuple[str, str]], *, partner_ids: Sequence[str], salt: str
+) -> Tuple[Dict[str, Set[str]], Dict[str, str]]:
+    """Find all versions of all concepts and fingerprint each concept's files
+
+    Args:
+        files: (path, etag) of all files in the collection
+        partner_ids: ids of partners with their own subfolder
+        salt: added to every fingerprint (see `get_concept_entries_salt`)
+
+    Returns:
+        - mapping of concept id to the set of its existing versions
+        - mapping of concept id to a fingerprint of its (input) files
+    """
+    concept_versions: Dict[str, Set[str]] = {}
+    concept_files: Dict[str, List[str]] = {}
+    for path, etag in files:
+        parts = path.split("/")
+        n_concept_parts = 2 if parts[0] in partner_ids else 1
+        concept_parts, rest = parts[:n_concept_parts], parts[n_concept_parts:]
+        if not rest or any(p.startswith(".") for p in concept_parts):
+            continue
+
+        concept_id = "/".join(concept_parts)
+        if (
+            len(rest) == 3
+            and rest[1:] == ["files", "rdf.yaml"]
+            and not rest[0].startswith(".")
+        ):
+            concept_versions.setdefault(concept_id, set()).add(rest[0])
+
+        if not (len(rest) == 1 and rest[0].startswith(CONCEPT_ENTRIES_PREFIX)):
+            # note: generated `versions.json` and `test_summary.yaml` files are
+            #   fingerprinted as well, such that entries are regenerated
+            #   if these outputs are removed or modified
+            concept_files.setdefault(concept_id, []).append(f"{path} {etag}")
+
+    fingerprints: Dict[str, str] = {}
+    for concept_id in concept_versions:
+        fingerprint = hashlib.sha256(salt.encode())
+        for f in sorted(concept_files[concept_id]):
+            fingerprint.update(f"\n{f}".encode())
+
+        fingerprints[concept_id] = fingerprint.hexdigest()
+
+    return concept_versions, fingerprints
+
+
 def create_collection_entries(
     versions: Sequence[Union[Record, RecordDraft]],
 ) -> Tuple[List[CollectionEntry], IdMap]:
@@ -1179,10 +1412,14 @@ def create_collection_entries(
     record_version: Optional[Union[Record, RecordDraft]] = None
     concept: Optional[str] = None
     id_info: Optional[IdInfo] = None
+    info: Optional[Union[DraftInfo, RecordInfo]] = None
+    concept_doi: Optional[str] = None
+    compat_reports: Optional[List[CompatibilityReport]] = None
 
     id_map: Dict[str, IdInfo] = {}
     version_infos: List[VersionInfo] = []
     for record_version in versions[::-1]:  # process oldest to newest
+        compat_reports = None
         rdf_version_data = record_version.client.load_file(record_version.rdf_path)
         if rdf_version_data is None:
             logger.error("failed to load {}", record_version.rdf_path)
@@ -1195,13 +1432,26 @@ def create_collection_entries(
         id_map[record_version.id] = id_info
         id_map[record_version.concept_id] = id_info
 
-        if record_version.doi is not None:
-            id_map[record_version.doi] = id_info
+        # load info only once per version
+        if isinstance(record_version, RecordDraft):
+            info = record_version.info
+            doi = None
+            concept_doi = record_version.concept_doi
+        else:
+            info = record_version.info
+            doi = info.doi
+            concept_doi = info.concept_doi
+
+        if doi is not None:
+            id_map[doi] = id_info
 
-        if record_version.concept_doi is not None:
-            id_map[record_version.concept_doi] = id_info
+        if concept_doi is not None:
+            id_map[concept_doi] = id_info
+
+        rdf = yaml.load(rdf_version_data)  # parse the bytes we just hashed
+        if not isinstance(rdf, dict):
+            raise ValueError(f"Expected {record_version.rdf_path} to hold a dictionary")
 
-        rdf = record_version.get_rdf()
         if (version_id := rdf["id"]) is not None and version_id not in id_map:
             id_map[version_id] = id_info
 
@@ -1216,15 +1466,7 @@ def create_collection_entries(
         id_map[concept] = id_info
 
         version_infos.append(
-            VersionInfo(
-                v=record_version.version,
-                created=record_version.info.created,
-                doi=(
-                    None
-                    if isinstance(record_version, RecordDraft)
-                    else record_version.info.doi
-                ),
-            )
+            VersionInfo(v=record_version.version, created=info.created, doi=doi)
         )
         compat_reports = record_version.get_all_compatibility_reports()
         compat_tests: Dict[str, List[TestSummaryEntry]] = {}
@@ -1233,7 +1475,7 @@ def create_collection_entries(
             if r.status == "not-applicable":
                 continue
 
-            if r.tool == f"bioimageio.core_{bioimageio.core.__version__}":
+            if r.tool == f"bioimageio.core_{BIOIMAGEIO_CORE_VERSION}":
                 bioimageio_status = r.status
 
             compat_tests.setdefault(r.tool, []).append(
@@ -1250,28 +1492,33 @@ def create_collection_entries(
             status=bioimageio_status, tests=compat_tests
         ).model_dump(mode="json")
         record_version.client.put_yaml(
-            test_summary, f"{record_version.folder}test_summary.yaml"
+            test_summary,
+            f"{record_version.folder}test_summary.yaml",
+            skip_unchanged=True,
         )
 
     assert rdf is not None
     assert record_version is not None
     assert concept is not None
     assert id_info is not None
+    assert info is not None
 
     # create an explicit entry only for the latest version
     #   (all versions are referenced under `versions`)
     # upload 'versions.json' summary
     if isinstance(record_version, Record):
         versions_info = VersionsInfo(
-            concept_doi=record_version.concept_doi, versions=version_infos[::-1]
+            concept_doi=concept_doi, versions=version_infos[::-1]
         )
-        record_version.concept.client.put_json(
+        record_version.concept.client.put_pydantic(
             f"{record_version.concept.folder}versions.json",
-            versions_info.model_dump(mode="json"),
+            versions_info,
+            skip_unchanged=True,
         )
         status = None
     elif isinstance(record_version, RecordDraft):
-        status = record_version.info.status
+        assert isinstance(info, DraftInfo)
+        status = info.status
     else:
         assert_never(record_version)
 
@@ -1298,7 +1545,8 @@ def create_collection_entries(
     # ingest compatibility reports
     links = set(rdf.get("links", []))
     tags = set(rdf.get("tags", []))
-    compat_reports = record_version.get_all_compatibility_reports()
+    if compat_reports is None:  # not yet loaded for the latest version
+        compat_reports = record_version.get_all_compatibility_reports()
 
     def get_compat_tag(tool: str):
         """make a special, derived tag for the automatic compatibility check result
@@ -1347,12 +1595,12 @@ def create_collection_entries(
                 maybe_swap_with_thumbnail(rdf.get("badges", []), thumbnails),
                 parsed_root,
             ),
-            concept_doi=record_version.concept_doi,
+            concept_doi=concept_doi,
             covers=resolve_relative_path(
                 maybe_swap_with_thumbnail(rdf.get("covers", []), thumbnails),
                 parsed_root,
             ),
-            created=record_version.info.created,
+            created=info.created,
             description=rdf["description"],
             download_count=download_count,
             download_url=rdf["download_url"] if "download_url" in rdf else None,
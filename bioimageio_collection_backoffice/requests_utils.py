@@ -1,9 +1,60 @@
-from io import BytesIO
+import hashlib
+from functools import cache
 from pathlib import PurePosixPath
-from typing import Any, Dict
+from typing import IO, Any, Dict, Union
 from urllib.parse import urlparse, urlunparse
 
 import requests
+from loguru import logger
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from ._settings import settings
+
+
+@cache
+def get_session() -> requests.Session:
+    """get a shared session to reuse (keep-alive) connections"""
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=16,
+        pool_maxsize=32,
+        max_retries=Retry(total=3, backoff_factor=0.3, allowed_methods=["GET"]),
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+def get_with_etag_cache(url: str) -> bytes:
+    """GET `url` with a local copy that is revalidated by its ETag
+    (the content is only transferred if it changed)"""
+    cache_file = (
+        settings.cache_path
+        / "http"
+        / hashlib.sha256(url.encode(), usedforsecurity=False).hexdigest()
+    )
+    etag_file = cache_file.with_suffix(".etag")
+    headers: Dict[str, str] = {}
+    if cache_file.exists() and etag_file.exists():
+        headers["If-None-Match"] = etag_file.read_text(encoding="utf-8")
+
+    r = get_session().get(url, headers=headers)
+    if r.status_code == 304:
+        logger.debug("using cached {}", url)
+        return cache_file.read_bytes()
+
+    raise_for_status_discretely(r)
+    if etag := r.headers.get("ETag"):
+        try:
+            cache_file.parent.mkdir(parents=True, exist_ok=True)
+            etag_file.unlink(missing_ok=True)
+            _ = cache_file.write_bytes(r.content)
+            _ = etag_file.write_text(etag, encoding="utf-8")
+        except OSError as e:
+            logger.warning("failed to cache {}: {}", url, e)
+
+    return r.content
 
 
 def raise_for_status_discretely(response: requests.Response):
@@ -47,21 +98,49 @@ def raise_for_status_discretely(response: requests.Response):
         raise requests.HTTPError(http_error_msg)
 
 
+class _SizedStream:
+    """file-like wrapper of a stream with a known size
+
+    `requests` determines the request body's size with `len()`; a body with a
+    known size is sent with a `Content-Length` header instead of chunked
+    transfer encoding.
+    """
+
+    def __init__(self, stream: IO[bytes], size: int):
+        super().__init__()
+        self._stream = stream
+        self._size = size
+
+    def __len__(self) -> int:
+        return self._size
+
+    def read(self, size: int = -1) -> bytes:
+        return self._stream.read(size)
+
+
 def put_file_from_url(
     file_url: str, destination_url: str, params: Dict[str, Any]
 ) -> None:
-    """Gets a remote file and pushes it up to a destination"""
+    """Gets a remote file and pushes it up to a destination
+    (streamed, without holding the whole file in memory)"""
     filename = PurePosixPath(urlparse(file_url).path).name
-    response = requests.get(file_url)
-    file_like = BytesIO(response.content)
-    put_file(file_like, f"{destination_url}/{filename}", params)
-    # TODO: Can we use stream=True and pass response.raw into requests.put?
-    #   response = requests.get(file_url, stream=True)
-    #   put_file(response.raw, filename, destination_url, params)
+    with get_session().get(file_url, stream=True) as response:
+        raise_for_status_discretely(response)
+        response.raw.decode_content = True
+        data: Union[IO[bytes], _SizedStream] = response.raw
+        if (
+            "Content-Encoding" not in response.headers
+            and (content_length := response.headers.get("Content-Length")) is not None
+        ):
+            data = _SizedStream(response.raw, int(content_length))
+
+        put_file(data, f"{destination_url}/{filename}", params)
 
 
-def put_file(file_object: BytesIO, url: str, params: Dict[str, Any]):
-    r = requests.put(
+def put_file(
+    file_object: Union[IO[bytes], _SizedStream], url: str, params: Dict[str, Any]
+):
+    r = get_session().put(
         url,
         data=file_object,
         params=params,
@@ -1,7 +1,8 @@
+import hashlib
 import traceback
 from functools import partialmethod
 from pathlib import Path
-from typing import Optional, Union
+from typing import Any, Dict, Iterable, Optional, Tuple, Union
 
 import bioimageio.core
 import bioimageio.spec
@@ -12,10 +13,9 @@ from bioimageio.spec.summary import (
     ValidationDetail,
     ValidationSummary,
 )
-from bioimageio.spec.utils import download
 from loguru import logger
 
-from .common import yaml
+from ._settings import settings
 from .db_structure.compatibility import CompatibilityReport
 from .db_structure.log import LogEntry
 from .gh_utils import render_summary
@@ -51,13 +51,40 @@ def run_dynamic_tests(
     create_env_outcome: str,
     conda_env_file: Path,
 ):
-    summary = _run_dynamic_tests_impl(
-        record.rdf_url, weight_format, create_env_outcome, conda_env_file
+    summary = None
+    cached = False
+    test_result_path = _get_test_result_path(
+        record, weight_format, create_env_outcome, conda_env_file
     )
+    if test_result_path is not None and not settings.force_retest:
+        cached_data = record.client.load_file(test_result_path)
+        if cached_data is not None:
+            summary = ValidationSummary.model_validate_json(cached_data)
+            cached = True
+            logger.info("reusing cached test result {}", test_result_path)
+
+    if summary is None:
+        summary = _run_dynamic_tests_impl(
+            record.rdf_url,
+            record.get_rdf(),
+            weight_format,
+            create_env_outcome,
+            conda_env_file,
+        )
+        if (
+            summary is not None
+            and summary.status == "passed"
+            and test_result_path is not None
+        ):
+            record.client.put_and_cache(
+                test_result_path, summary.model_dump_json().encode()
+            )
+
     if summary is not None:
         record.add_log_entry(
             LogEntry(
-                message=f"bioimageio.core {bioimageio.core.__version__} test {summary.status}",
+                message=f"bioimageio.core {bioimageio.core.__version__} test {summary.status}"
+                + (" (cached test reused)" if cached else ""),
                 details=summary,
                 details_formatted=summary.format(),
             )
@@ -77,8 +104,61 @@ def run_dynamic_tests(
         record.set_compatibility_report(report)
 
 
+def _get_test_result_path(
+    record: Union[Record, RecordDraft],
+    weight_format: Optional[WeightsFormat],
+    create_env_outcome: str,
+    conda_env_file: Path,
+) -> Optional[str]:
+    """path of a (passed) test result for the given test inputs
+    (see `get_test_inputs_hash`)"""
+    if weight_format is None or create_env_outcome != "success":
+        return None
+
+    rdf_data = record.client.load_file(record.rdf_path)
+    if rdf_data is None:
+        return None
+
+    h = get_test_inputs_hash(
+        rdf_data=rdf_data,
+        files=record.client.ls_files_with_etag(f"{record.folder}files/"),
+        weight_format=weight_format,
+        conda_env=conda_env_file.read_bytes() if conda_env_file.exists() else None,
+    )
+    return f"{record.folder}test_results/{h}.json"
+
+
+def get_test_inputs_hash(
+    *,
+    rdf_data: bytes,
+    files: Iterable[Tuple[str, str]],
+    weight_format: WeightsFormat,
+    conda_env: Optional[bytes],
+) -> str:
+    """hash the inputs of a dynamic test, such that any change to them invalidates
+    a stored test result
+
+    Args:
+        rdf_data: content of the tested rdf.yaml
+        files: (path, etag) of all files of the tested record
+            (the rdf.yaml alone does not change with reuploaded weights, etc.)
+        weight_format: tested weight format
+        conda_env: content of the conda environment file the test runs in
+    """
+    h = hashlib.sha256(rdf_data)
+    for path, etag in sorted(files):
+        h.update(f"\n{path} {etag}".encode())
+
+    h.update(f"\n{weight_format}\n{bioimageio.core.__version__}\n".encode())
+    if conda_env is not None:
+        h.update(conda_env)
+
+    return h.hexdigest()
+
+
 def _run_dynamic_tests_impl(
     rdf_url: str,
+    rdf: Dict[str, Any],
     weight_format: Optional[WeightsFormat],
     create_env_outcome: str,
     conda_env_file: Path,
@@ -110,7 +190,6 @@ def _run_dynamic_tests_impl(
             )
         else:
             try:
-                rdf = yaml.load(download(rdf_url).path)
                 test_kwargs = (
                     rdf.get("config", {})
                     .get("bioimageio", {})
@@ -1,26 +1,34 @@
 from __future__ import annotations
 
 import io
-import json
+import os
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
 from dataclasses import dataclass, field
-from pathlib import Path
+from functools import lru_cache
+from hashlib import md5
+from itertools import islice
 from typing import (
+    IO,
     Any,
     BinaryIO,
+    Iterable,
     Iterator,
     List,
     Optional,
-    Sequence,
+    Tuple,
     TypeVar,
-    Union,
+    cast,
 )
 
+import certifi
+import urllib3
 from loguru import logger
 from minio import Minio, S3Error
 from minio.commonconfig import CopySource
 from minio.datatypes import Object
 from minio.deleteobjects import DeleteObject
 from pydantic import BaseModel, SecretStr
+from pydantic_core import to_json
 
 from ._settings import settings
 from .cache import SizedValueLRU
@@ -29,6 +37,29 @@ from .common import yaml
 M = TypeVar("M", bound=BaseModel)
 
 
+@lru_cache(maxsize=8)
+def _get_minio(host: str, access_key: str, secret_key: str, pool_size: int):
+    """get a (shared) `Minio` client to reuse its connection pool"""
+    return Minio(
+        host,
+        access_key=access_key,
+        secret_key=secret_key,
+        # same as minio's default http client, but with a larger pool
+        # to serve concurrent requests from up to `pool_size` threads
+        http_client=urllib3.PoolManager(
+            timeout=urllib3.Timeout(connect=300, read=300),
+            maxsize=pool_size,
+            cert_reqs="CERT_REQUIRED",
+            ca_certs=os.environ.get("SSL_CERT_FILE") or certifi.where(),
+            retries=urllib3.Retry(
+                total=5,
+                backoff_factor=0.2,
+                status_forcelist=[500, 502, 503, 504],
+            ),
+        ),
+    )
+
+
 @dataclass
 class Client:
     """Convenience wrapper around a `Minio` S3 client"""
@@ -44,6 +75,14 @@ class Client:
     secret_key: SecretStr = field(default=settings.s3_secret_access_key, repr=False)
     """S3 secret key"""
     max_bytes_cached: int = int(1e9)
+    max_workers: int = 32
+    """maximum number of concurrent requests"""
+    num_parallel_uploads: int = 4
+    """number of parts uploaded in parallel for a multipart upload (large files)"""
+    delete_batch_size: int = 1000
+    """number of objects to delete per request (S3 allows up to 1000)"""
+    delete_concurrency: int = 8
+    """maximum number of concurrent delete requests"""
     _client: Minio = field(init=False, compare=False, repr=False)
     _cache: Optional[SizedValueLRU[str, Optional[bytes]]] = field(
         init=False, compare=False, repr=False
@@ -54,10 +93,13 @@ class Client:
         if not self.prefix:
             raise ValueError("empty prefix not allowed")
 
-        self._client = Minio(
+        self._client = _get_minio(
             self.host,
-            access_key=self.access_key.get_secret_value(),
-            secret_key=self.secret_key.get_secret_value(),
+            self.access_key.get_secret_value(),
+            self.secret_key.get_secret_value(),
+            # each of `max_workers` concurrent (multipart) uploads
+            # may use up to `num_parallel_uploads` connections
+            self.max_workers * self.num_parallel_uploads,
         )
         found = self._bucket_exists(self.bucket)
         if not found:
@@ -74,13 +116,33 @@ class Client:
     def _bucket_exists(self, bucket: str) -> bool:
         return self._client.bucket_exists(bucket)
 
-    def put_and_cache(self, path: str, file: bytes):
-        self.put(path, io.BytesIO(file), length=len(file))
+    def put_and_cache(self, path: str, file: bytes, *, skip_unchanged: bool = False):
+        """upload (and cache) `file`
+
+        Args:
+            path: target path
+            file: file content
+            skip_unchanged: Skip the upload if the remote object already has
+                the same content (as indicated by its ETag).
+        """
+        if skip_unchanged and self._is_unchanged(path, file):
+            logger.info("Skipping upload of unchanged {}", path)
+        else:
+            self.put(path, io.BytesIO(file), length=len(file))
+
         if self._cache is not None:
             self._cache.update((path,), file, only_if_cached=False)
 
+    def uncache(self, prefix: str = ""):
+        """drop cached file contents of all objects starting with `prefix`"""
+        if self._cache is not None:
+            self._cache.pop_where(lambda key: key[0].startswith(prefix))
+
     def put(
-        self, path: str, file_object: Union[io.BytesIO, BinaryIO], length: Optional[int]
+        self,
+        path: str,
+        file_object: IO[bytes],
+        length: Optional[int],
     ) -> None:
         """upload a file(like object)"""
         # For unknown length (ie without reading file into mem) give `part_size`
@@ -98,37 +160,78 @@ class Client:
         _ = self._client.put_object(
             self.bucket,
             prefixed_path,
-            file_object,
+            # minio only `read`s from `data` (typed as `BinaryIO`)
+            cast(BinaryIO, file_object),
             length=length,
             part_size=part_size,
+            num_parallel_uploads=self.num_parallel_uploads,
         )
         logger.info("Uploaded {}", self.get_file_url(path))
 
-    def put_pydantic(self, path: str, obj: BaseModel):
+    def _is_unchanged(self, path: str, data: bytes) -> bool:
+        """check if the object at `path` holds `data` by comparing its ETag
+
+        (The ETag of an object uploaded in a single part is its MD5 hash;
+        multipart ETags never match and result in `False`.)
+        """
+        try:
+            stat = self._client.stat_object(self.bucket, f"{self.prefix}/{path}")
+        except S3Error as e:
+            if e.code in ("NoSuchKey", "NoSuchObject"):
+                return False
+
+            raise
+
+        if stat.etag is None:
+            return False
+
+        return stat.etag.strip('"') == md5(data, usedforsecurity=False).hexdigest()
+
+    def put_pydantic(
+        self,
+        path: str,
+        obj: BaseModel,
+        *,
+        exclude_defaults: bool = False,
+        skip_unchanged: bool = False,
+    ):
         """upload a json file from a pydantic model"""
-        self.put_json_string(path, obj.model_dump_json(exclude_defaults=False))
+        self.put_json_string(
+            path,
+            obj.model_dump_json(exclude_defaults=exclude_defaults),
+            skip_unchanged=skip_unchanged,
+        )
 
     def put_json(
-        self, path: str, json_value: Any  # TODO: type json_value as JsonValue
+        self,
+        path: str,
+        json_value: Any,  # TODO: type json_value as JsonValue
+        *,
+        skip_unchanged: bool = False,
     ):
         """upload a json file from a json serializable value"""
-        json_str = json.dumps(json_value)
-        self.put_json_string(path, json_str)
+        self.put_and_cache(path, to_json(json_value), skip_unchanged=skip_unchanged)
 
-    def put_yaml(self, yaml_value: Any, path: str):
+    def put_yaml(self, yaml_value: Any, path: str, *, skip_unchanged: bool = False):
         """upload a yaml file from a yaml serializable value"""
         stream = io.StringIO()
         yaml.dump(yaml_value, stream)
         data = stream.getvalue().encode()
+        if skip_unchanged and self._is_unchanged(path, data):
+            logger.info("Skipping upload of unchanged {}", path)
+            return
+
         self.put(
             path,
             io.BytesIO(data),
             length=len(data),
         )
 
-    def put_json_string(self, path: str, json_str: str):
+    def put_json_string(
+        self, path: str, json_str: str, *, skip_unchanged: bool = False
+    ):
         data = json_str.encode()
-        self.put_and_cache(path, data)
+        self.put_and_cache(path, data, skip_unchanged=skip_unchanged)
 
     def get_file_urls(
         self,
@@ -193,7 +296,29 @@ class Client:
             ):
                 continue
 
-            yield Path(obj.object_name).name
+            # (folder names end with '/')
+            yield obj.object_name.rstrip("/").rsplit("/", 1)[-1]
+
+    def ls_files(self, path: str = "", *, suffix: str = "") -> Iterator[str]:
+        """List all files under `path` recursively (optionally only those ending
+        with `suffix`); yields paths relative to the client's prefix"""
+        for file_path, _ in self.ls_files_with_etag(path):
+            if file_path.endswith(suffix):
+                yield file_path
+
+    def ls_files_with_etag(self, path: str = "") -> Iterator[Tuple[str, str]]:
+        """List all files under `path` recursively;
+        yields paths relative to the client's prefix together with their ETag"""
+        prefix_folder = f"{self.prefix}/"
+        path = f"{prefix_folder}{path}"
+        logger.debug("Running recursive ls at path: {}", path)
+        objects = self._client.list_objects(self.bucket, prefix=path, recursive=True)
+        for obj in objects:
+            if obj.is_dir or obj.object_name is None:
+                continue
+
+            assert obj.object_name.startswith(prefix_folder), obj.object_name
+            yield obj.object_name[len(prefix_folder) :], (obj.etag or "").strip('"')
 
     def cp_dir(self, src: str, tgt: str):
         _ = self._cp_dir(src, tgt)
@@ -206,10 +331,8 @@ class Client:
     def rm_dir(self, prefix: str, *, bypass_governance_mode: bool = False):
         """remove all objects under `prefix`"""
         assert prefix == "" or prefix.endswith("/")
-        objects = list(
-            self._client.list_objects(
-                self.bucket, f"{self.prefix}/{prefix}", recursive=True
-            )
+        objects = self._client.list_objects(
+            self.bucket, f"{self.prefix}/{prefix}", recursive=True
         )
         self._rm_objs(objects, bypass_governance_mode=bypass_governance_mode)
 
@@ -219,8 +342,8 @@ class Client:
         src = f"{self.prefix}/{src}"
         tgt = f"{self.prefix}/{tgt}"
         objects = list(self._client.list_objects(self.bucket, src, recursive=True))
-        # copy
-        for obj in objects:
+
+        def copy(obj: Object):
             assert obj.object_name is not None and obj.object_name.startswith(src)
             tgt_obj_name = f"{tgt}{obj.object_name[len(src) :]}"
 
@@ -230,25 +353,40 @@ class Client:
                 CopySource(self.bucket, obj.object_name),
             )
 
+        # copy concurrently (server side copies are latency bound)
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            futures = [executor.submit(copy, obj) for obj in objects]
+            for fut in as_completed(futures):
+                fut.result()  # raise any copy error
+
         return objects
 
     def rm(self, object: str):
         self._client.remove_object(self.bucket, f"{self.prefix}/{object}")
 
     def _rm_objs(
-        self, objects: Sequence[Object], *, bypass_governance_mode: bool
+        self, objects: Iterable[Object], *, bypass_governance_mode: bool
     ) -> None:
-        _ = list(
-            self._client.remove_objects(
-                self.bucket,
-                (
-                    DeleteObject(obj.object_name)
-                    for obj in objects
-                    if obj.object_name is not None
-                ),
-                bypass_governance_mode=bypass_governance_mode,
-            )
-        )
+        """delete `objects` in batches of `delete_batch_size`
+        with up to `delete_concurrency` concurrent requests
+        (consumes `objects` lazily, e.g. while it is still being listed)"""
+
+        def rm_batch(batch: List[DeleteObject]):
+            for error in self._client.remove_objects(
+                self.bucket, batch, bypass_governance_mode=bypass_governance_mode
+            ):
+                logger.error("Failed to delete {}: {}", error.name, error.message)
+
+        names = (obj.object_name for obj in objects if obj.object_name is not None)
+        with ThreadPoolExecutor(max_workers=self.delete_concurrency) as executor:
+            futures: List[Future[None]] = []
+            while batch := [
+                DeleteObject(n) for n in islice(names, self.delete_batch_size)
+            ]:
+                futures.append(executor.submit(rm_batch, batch))
+
+            for fut in as_completed(futures):
+                fut.result()
 
     def load_file(self, path: str, /) -> Optional[bytes]:
         """Load file
@@ -256,6 +394,7 @@ class Client:
         Returns:
             file content or `None` if no object at `path` was found.
         """
+        response = None
         try:
             response = self._client.get_object(self.bucket, f"{self.prefix}/{path}")
             content = response.read()
@@ -266,18 +405,53 @@ class Client:
             else:
                 logger.critical("Failed to get object {} with {}", path, self)
                 raise
-
         else:
             logger.debug("Loaded {}", path)
-
-            try:
-                response.close()
-                response.release_conn()
-            except Exception:
-                pass
+        finally:
+            # return the connection to the pool, even if reading failed
+            if response is not None:
+                try:
+                    response.close()
+                    response.release_conn()
+                except Exception:
+                    pass
 
         return content
 
+    def download(self, path: str, output_path: str) -> bool:
+        """Download a file to `output_path` (without loading it into memory)
+
+        Returns:
+            `False` if no object at `path` was found.
+        """
+        try:
+            _ = self._client.fget_object(
+                self.bucket, f"{self.prefix}/{path}", output_path
+            )
+        except S3Error as e:
+            if e.code == "NoSuchKey":
+                logger.info("Object {} not found with {}", path, self)
+                return False
+
+            raise
+
+        return True
+
+    def prefetch(self, paths: Iterable[str]):
+        """load (small) files concurrently into the cache"""
+        if self._cache is None:
+            return
+
+        paths = list(paths)
+        if len(paths) < 2:
+            return
+
+        with ThreadPoolExecutor(
+            max_workers=min(len(paths), self.max_workers)
+        ) as executor:
+            for _ in executor.map(self.load_file, paths):
+                pass
+
     def get_file_url(self, path: str) -> str:
         """Get the full URL to `path`"""
         return f"https://{self.host}/{self.bucket}/{self.prefix}/{path}"
@@ -22,19 +22,19 @@ def remove_colab_badges():
         r.client.put(r.rdf_path, BytesIO(data), len(data))
 
         path = f"{r.folder}files/colab-badge.svg"
-        if list(r.client.ls(path)):
+        if any(r.client.ls(path)):
             r.client.rm(path)
 
 
 def add_info_json():
     rc = RemoteCollection(Client())
     for r in rc.get_published_versions():
-        if not list(r.client.ls(r.folder + "info.json")):
+        if not any(r.client.ls(r.folder + "info.json")):
             info = r.info
             r.update_info(info)
 
     for r in rc.get_drafts():
-        if not list(r.client.ls(r.folder + "info.json")):
+        if not any(r.client.ls(r.folder + "info.json")):
             info = r.info
             r.update_info(info)
 
@@ -1,3 +1,5 @@
+from concurrent.futures import ThreadPoolExecutor
+
 import biapy
 from biapy.models import check_bmz_model_compatibility
 from loguru import logger
@@ -14,7 +16,7 @@ def check_compatibility_biapy_impl(
     tool: str,
 ):
     report_path = record.get_compatibility_report_path(tool)
-    if list(record.client.ls(report_path)):
+    if any(record.client.ls(report_path)):
         return
 
     rdf = record.get_rdf()
@@ -41,18 +43,24 @@ def check_compatibility_biapy_impl(
 
 
 def check_compatibility_biapy():
-    collection = RemoteCollection(Client())
-    for record in collection.get_published_versions():
+    client = Client()
+    collection = RemoteCollection(client)
+    tool = f"biapy_{biapy.__version__}"
+
+    def check_record(record: Record):
         try:
-            report = check_compatibility_biapy_impl(
-                record, f"biapy_{biapy.__version__}"
-            )
+            report = check_compatibility_biapy_impl(record, tool)
         except Exception as e:
             logger.error(f"failed to check '{record.id}': {e}")
         else:
             if report is not None:
                 record.set_compatibility_report(report)
 
+    # records are checked independently; their rdf.yaml downloads and report
+    # uploads are latency bound, so we check them concurrently
+    with ThreadPoolExecutor(max_workers=client.max_workers) as executor:
+        _ = list(executor.map(check_record, collection.get_published_versions()))
+
 
 if __name__ == "__main__":
     check_compatibility_biapy()
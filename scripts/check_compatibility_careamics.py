@@ -1,5 +1,6 @@
 from typing import Protocol, Optional, Union, Tuple, List
 import argparse
+import os
 from pathlib import Path
 import traceback
 from functools import lru_cache
@@ -186,6 +187,9 @@ def check_compatibility_careamics(all_version_path: Path, output_folder: Path) -
         output_folder=output_folder,
         check_tool_compatibility_impl=check_compatibility_careamics_impl,
         applicable_types={"model"},
+        # checks run model inference (itself multi-threaded) in this process,
+        # so we limit concurrent checks by CPU count, not by network latency
+        max_workers=max(1, (os.cpu_count() or 1) // 4),
     )
 
 
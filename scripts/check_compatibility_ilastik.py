@@ -1,4 +1,5 @@
 import argparse
+import os
 from pathlib import Path
 from typing import TYPE_CHECKING
 
@@ -92,6 +93,9 @@ def check_compatibility_ilastik(
         output_folder=output_folder,
         check_tool_compatibility_impl=check_compatibility_ilastik_impl,
         applicable_types={"model"},
+        # checks run model inference (itself multi-threaded) in this process,
+        # so we limit concurrent checks by CPU count, not by network latency
+        max_workers=max(1, (os.cpu_count() or 1) // 4),
     )
 
 
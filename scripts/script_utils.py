@@ -1,22 +1,48 @@
 import hashlib
 import json
+import os
 import traceback
 import warnings
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
-from typing import TYPE_CHECKING, Any, Callable, Dict, Optional, Sequence, Set, Union
+from tempfile import NamedTemporaryFile
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Optional,
+    Sequence,
+    Set,
+    TypeVar,
+    Union,
+)
 
 import requests
+from requests.adapters import HTTPAdapter
 from typing_extensions import Literal, NotRequired, TypedDict, TypeGuard
+from urllib3.util.retry import Retry
 
 try:
     from ruyaml import YAML
 except ImportError:
     from ruamel.yaml import YAML
 
+T = TypeVar("T")
+
 try:
     from tqdm import tqdm
 except ImportError:
-    tqdm = list
+
+    def tqdm(iterable: Iterable[T], **kwargs: Any) -> Iterable[T]:
+        return iterable
+
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 if TYPE_CHECKING:
     from bioimageio_collection_backoffice.db_structure.compatibility import (
@@ -25,6 +51,20 @@ if TYPE_CHECKING:
 
 yaml = YAML(typ="safe")
 
+RDF_CACHE_DIR = Path.home() / ".cache" / "bioimageio_collection_backoffice" / "rdf"
+"""local cache of rdf.yaml files (by sha256)"""
+
+SESSION = requests.Session()
+"""session to reuse (keep-alive) connections across the many small rdf.yaml requests"""
+SESSION.mount(
+    "https://",
+    HTTPAdapter(
+        pool_connections=32,
+        pool_maxsize=64,
+        max_retries=Retry(total=3, backoff_factor=0.3),
+    ),
+)
+
 
 class CompatibilityReportDict(TypedDict):
     """TypedDict version of
@@ -55,6 +95,7 @@ def check_tool_compatibility(
         [str, str], Union[CompatibilityReportDict, "CompatibilityReport"]
     ],
     applicable_types: Set[str],
+    max_workers: Optional[int] = None,
 ):
     """helper to implement tool compatibility checks
 
@@ -69,6 +110,8 @@ def check_tool_compatibility(
             And returning a compatibility report.
         applicable_types: Set of resource types
             **check_tool_compatibility_impl** is applicable to.
+        max_workers: Number of resource versions to check concurrently.
+            Defaults to `min(32, 4 * os.cpu_count())`.
     """
     if "_" in tool_name:
         raise ValueError("Underscore not allowed in tool_name")
@@ -83,50 +126,103 @@ def check_tool_compatibility(
         entry for entry in all_versions if entry["type"] in applicable_types
     ]
 
-    for entry in tqdm(filtered_versions):
-        for version in entry["versions"]:
-            rdf_url = version["source"]
-            sha256 = version["sha256"]
-
-            report_url = (
-                "/".join(rdf_url.split("/")[:-2])
-                + f"/compatibility/ilastik_{tool_version}.yaml"
-            )
-            r = requests.head(report_url)
-            if r.status_code != 404:
-                r.raise_for_status()  # raises if failed to check if report exists
-                continue  # report already exists
-
-            try:
-                report = check_tool_compatibility_impl(rdf_url, sha256)
-            except Exception as e:
-                traceback.print_exc()
-                warnings.warn(f"failed to check '{rdf_url}': {e}")
-            else:
-                if not isinstance(report, dict):
-                    report = report.model_dump(mode="json")
-
-                report_path = output_folder / (
-                    "/".join(rdf_url.split("/")[-4:-2])
-                    + f"/compatibility/{tool_name}_{tool_version}.json"
-                )
-                report_path.parent.mkdir(parents=True, exist_ok=True)
-                with report_path.open("wt", encoding="utf-8") as f:
-                    json.dump(report, f)
+    report_name = f"{tool_name}_{tool_version}.json"
+    # find reports already generated locally with a single directory walk
+    existing_reports = {
+        p.relative_to(output_folder).as_posix()
+        for p in output_folder.glob(f"*/*/compatibility/{report_name}")
+    }
+
+    def get_report_key(rdf_url: str):
+        return "/".join(rdf_url.split("/")[-4:-2]) + f"/compatibility/{report_name}"
+
+    def check_version(rdf_url: str, sha256: str):
+        report_url = "/".join(rdf_url.split("/")[:-2]) + f"/compatibility/{report_name}"
+        r = SESSION.head(report_url)
+        if r.status_code != 404:
+            r.raise_for_status()  # raises if failed to check if report exists
+            return  # report already exists
+
+        try:
+            report = check_tool_compatibility_impl(rdf_url, sha256)
+        except Exception as e:
+            traceback.print_exc()
+            warnings.warn(f"failed to check '{rdf_url}': {e}")
+        else:
+            if not isinstance(report, dict):
+                report = report.model_dump(mode="json")
+
+            report_path = output_folder / get_report_key(rdf_url)
+            _write_atomically(report_path, _dump_json(report))
+
+    if max_workers is None:
+        max_workers = min(32, (os.cpu_count() or 1) * 4)
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = [
+            executor.submit(check_version, version["source"], version["sha256"])
+            for entry in filtered_versions
+            for version in entry["versions"]
+            if get_report_key(version["source"]) not in existing_reports
+        ]
+        for fut in tqdm(as_completed(futures), total=len(futures)):
+            fut.result()
+
+
+def _dump_json(data: Any) -> bytes:
+    """compact JSON encoding (using orjson if available)"""
+    if orjson is None:
+        return json.dumps(data, ensure_ascii=False, separators=(",", ":")).encode(
+            "utf-8"
+        )
+    else:
+        return orjson.dumps(data)
 
 
-def download_and_check_hash(url: str, sha256: str) -> bytes:
-    r = requests.get(url)
-    r.raise_for_status()
-    data = r.content
+# current umask (read once; setting it is process wide and not thread safe)
+_UMASK = os.umask(0)
+_ = os.umask(_UMASK)
+
+
+def _write_atomically(path: Path, data: bytes):
+    """write to a temporary file first and replace **path** with it,
+    so **path** is never left partially written"""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with NamedTemporaryFile(dir=path.parent, delete=False) as tmp:
+        tmp_path = Path(tmp.name)
+        try:
+            _ = tmp.write(data)
+        except BaseException:
+            tmp.close()
+            tmp_path.unlink(missing_ok=True)
+            raise
 
-    actual = hashlib.sha256(data).hexdigest()
+    try:
+        # NamedTemporaryFile creates files with mode 0600; use the usual mode instead
+        os.chmod(tmp_path, 0o666 & ~_UMASK)
+        os.replace(tmp_path, path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+
+
+def download_and_check_hash(url: str, sha256: str) -> bytes:
+    # hash incrementally while streaming the download
+    h = hashlib.sha256()
+    data = bytearray()
+    with SESSION.get(url, stream=True) as r:
+        r.raise_for_status()
+        for chunk in r.iter_content(chunk_size=1 << 16):
+            h.update(chunk)
+            data.extend(chunk)
+
+    actual = h.hexdigest()
     if actual != sha256:
         raise ValueError(
             f"found sha256='{actual}' for downlaoded {url}, but exptected '{sha256}'"
         )
 
-    return data
+    return bytes(data)
 
 
 def _is_str_dict(d: Any) -> TypeGuard[Dict[str, Any]]:
@@ -136,7 +232,15 @@ def _is_str_dict(d: Any) -> TypeGuard[Dict[str, Any]]:
 
 
 def download_rdf(rdf_url: str, sha256: str) -> Dict[str, Any]:
-    rdf_data = download_and_check_hash(rdf_url, sha256)
-    rdf: Any = yaml.load(rdf_data.decode())
+    # rdf.yaml files are addressed by their content hash;
+    # a cached file is therefore always valid
+    cache_path = RDF_CACHE_DIR / sha256[:2] / f"{sha256}.yaml"
+    if cache_path.exists():
+        rdf_data = cache_path.read_bytes()
+    else:
+        rdf_data = download_and_check_hash(rdf_url, sha256)
+        _write_atomically(cache_path, rdf_data)
+
+    rdf: Any = yaml.load(rdf_data)
     assert _is_str_dict(rdf)
     return rdf
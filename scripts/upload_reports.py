@@ -1,9 +1,9 @@
-import json
 import warnings
 from pathlib import Path
 from typing import Any, Dict, Union
 
 import fire
+from pydantic_core import from_json
 
 from bioimageio_collection_backoffice.common import yaml
 from bioimageio_collection_backoffice.db_structure.compatibility import (
@@ -27,9 +27,8 @@ def upload_reports(reports_folder: Union[Path, str]):
         if p.suffix in (".yml", ".yaml"):
             with p.open("rt", encoding="utf-8") as f:
                 report_data: Union[Any, Dict[Any, Any]] = yaml.load(f)
-        elif p.suffix in (".json"):
-            with p.open("rt", encoding="utf-8") as f:
-                report_data = json.load(f)
+        elif p.suffix == ".json":
+            report_data = from_json(p.read_bytes())
         else:
             warnings.warn(f"ignoring '{p}' for its unknown suffix.")
             continue
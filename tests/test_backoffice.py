@@ -1,11 +1,32 @@
+from typing import List, Literal
+
+import pytest
+
 from bioimageio_collection_backoffice import BackOffice
 from bioimageio_collection_backoffice._settings import settings
 
 
-def test_backoffice(backoffice: BackOffice, package_url: str, package_id: str):
+def test_backoffice(
+    backoffice: BackOffice,
+    package_url: str,
+    package_id: str,
+    monkeypatch: pytest.MonkeyPatch,
+):
     backoffice.generate_collection_json()  # create initial collection.json
     backoffice.draft(concept_id=package_id, package_url=package_url)
     backoffice.test(concept_id=package_id, version="draft")
     backoffice.publish(concept_id=package_id, reviewer="github|15139589")
     backoffice.generate_collection_json()
     backoffice.backup(settings.zenodo_test_url)
+
+    # without newly backed up versions the collection json files are not regenerated
+    generated: List[str] = []
+
+    def generate_collection_json(mode: Literal["published", "draft"] = "published"):
+        generated.append(mode)
+
+    monkeypatch.setattr(
+        backoffice, "generate_collection_json", generate_collection_json
+    )
+    backoffice.backup()
+    assert not generated
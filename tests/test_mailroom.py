@@ -0,0 +1,51 @@
+from typing import List, Tuple
+
+import pytest
+
+from bioimageio_collection_backoffice.s3_client import Client
+
+
+def test_outbox(non_collection_client: Client, monkeypatch: pytest.MonkeyPatch):
+    from bioimageio_collection_backoffice.mailroom import send_email as mailroom
+    from bioimageio_collection_backoffice.remote_collection import RecordDraft
+
+    client = non_collection_client
+    client.put_and_cache(
+        "mail-test/draft/files/rdf.yaml",
+        b"uploader:\n  name: Uploader\n  email: uploader@example.com\n",
+    )
+    draft = RecordDraft(client=client, concept_id="mail-test")
+
+    sent: List[Tuple[str, List[str]]] = []
+
+    def failing_send_email(subject: str, body: str, recipients: List[str]):
+        raise RuntimeError("SMTP is down")
+
+    def send_email(subject: str, body: str, recipients: List[str]):
+        sent.append((subject, recipients))
+
+    mailroom.enqueue_notify_uploader(draft, "is awaiting review ⌛", "Thanks!")
+    queued = list(client.ls_files(mailroom.OUTBOX, suffix=".json"))
+    assert len(queued) == 1
+
+    # a failed send leaves the email queued
+    monkeypatch.setattr(mailroom, "send_email", failing_send_email)
+    with pytest.raises(RuntimeError):
+        mailroom.flush_outbox(client)
+
+    assert list(client.ls_files(mailroom.OUTBOX, suffix=".json")) == queued
+    assert not sent
+
+    # a successful send removes it from the outbox
+    monkeypatch.setattr(mailroom, "send_email", send_email)
+    mailroom.flush_outbox(client)
+    assert sent == [
+        (
+            f"{mailroom.STATUS_UPDATE_SUBJECT}mail-test/draft draft is awaiting"
+            " review ⌛",
+            ["uploader@example.com"],
+        )
+    ]
+    assert not list(client.ls_files(mailroom.OUTBOX, suffix=".json"))
+
+    client.rm_dir("mail-test/")
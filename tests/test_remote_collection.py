@@ -25,3 +25,78 @@ def test_generate_resource_id(client: Client, type_: str):
 
     cid = rc.generate_concept_id(type_)
     assert rc.validate_concept_id(cid, type_=type_) is None
+
+
+def test_scan_concept_files():
+    from bioimageio_collection_backoffice.remote_collection import (
+        CONCEPT_ENTRIES_PREFIX,
+        scan_concept_files,
+    )
+
+    files = [
+        ("affable-shark/1/files/rdf.yaml", "a"),
+        ("affable-shark/1/files/weights.pt", "b"),
+        ("affable-shark/draft/files/rdf.yaml", "c"),
+        ("affable-shark/versions.json", "d"),
+        (f"affable-shark/{CONCEPT_ENTRIES_PREFIX}published.json", "e"),
+        ("partner/ambitious-ant/1/files/rdf.yaml", "f"),
+        (".hidden/1/files/rdf.yaml", "g"),
+    ]
+    versions, fingerprints = scan_concept_files(
+        files, partner_ids=["partner"], salt="salt"
+    )
+    assert versions == {
+        "affable-shark": {"1", "draft"},
+        "partner/ambitious-ant": {"1"},
+    }
+    assert set(fingerprints) == set(versions)
+
+    # cache hit: same files (in any order); cached entries are ignored
+    _, fingerprints_hit = scan_concept_files(
+        [
+            *files[::-1],
+            (f"affable-shark/{CONCEPT_ENTRIES_PREFIX}published.json", "changed"),
+        ],
+        partner_ids=["partner"],
+        salt="salt",
+    )
+    assert fingerprints_hit == fingerprints
+
+    # cache miss: generated files were removed (and need to be regenerated)
+    _, fingerprints_removed = scan_concept_files(
+        [f for f in files if not f[0].endswith("versions.json")],
+        partner_ids=["partner"],
+        salt="salt",
+    )
+    assert fingerprints_removed["affable-shark"] != fingerprints["affable-shark"]
+
+    # cache miss: a changed (non-rdf) file changes only its concept's fingerprint
+    _, fingerprints_miss = scan_concept_files(
+        [(p, "changed" if p.endswith("weights.pt") else e) for p, e in files],
+        partner_ids=["partner"],
+        salt="salt",
+    )
+    assert fingerprints_miss["affable-shark"] != fingerprints["affable-shark"]
+    assert (
+        fingerprints_miss["partner/ambitious-ant"]
+        == fingerprints["partner/ambitious-ant"]
+    )
+
+    # invalidation: a different salt changes all fingerprints
+    _, fingerprints_invalidated = scan_concept_files(
+        files, partner_ids=["partner"], salt="other salt"
+    )
+    assert all(fingerprints_invalidated[c] != f for c, f in fingerprints.items())
+
+
+def test_concept_entries_salt():
+    from bioimageio_collection_backoffice.collection_config import CollectionConfig
+    from bioimageio_collection_backoffice.remote_collection import (
+        get_concept_entries_salt,
+    )
+
+    config = CollectionConfig.load()
+    salt = get_concept_entries_salt(config)
+    assert salt == get_concept_entries_salt(config)
+    changed_config = config.model_copy(update={"reviewers": []})
+    assert get_concept_entries_salt(changed_config) != salt
@@ -0,0 +1,68 @@
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from threading import Thread
+from typing import Dict, List
+
+import pytest
+
+
+def test_get_with_etag_cache(tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+    from bioimageio_collection_backoffice import requests_utils
+    from bioimageio_collection_backoffice._settings import settings
+
+    monkeypatch.setattr(
+        requests_utils,
+        "settings",
+        settings.model_copy(update={"cache_path": tmp_path}),
+    )
+    url = settings.collection_config
+    data = requests_utils.get_with_etag_cache(url)
+    cached_files = list((tmp_path / "http").iterdir())
+    assert len(cached_files) == 2  # content and its etag
+    (cache_file,) = [f for f in cached_files if f.suffix != ".etag"]
+    assert cache_file.read_bytes() == data
+
+    # unchanged remote content is served from the local copy
+    _ = cache_file.write_bytes(b"local copy")
+    assert requests_utils.get_with_etag_cache(url) == b"local copy"
+
+    # without a stored etag the content is downloaded again
+    cache_file.with_suffix(".etag").unlink()
+    assert requests_utils.get_with_etag_cache(url) == data
+
+
+def test_put_file_from_url_headers():
+    from bioimageio_collection_backoffice.requests_utils import put_file_from_url
+
+    content = b"file content"
+    put_requests: List[Dict[str, str]] = []
+    put_bodies: List[bytes] = []
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            self.send_response(200)
+            self.send_header("Content-Length", str(len(content)))
+            self.end_headers()
+            _ = self.wfile.write(content)
+
+        def do_PUT(self):
+            put_requests.append(dict(self.headers))
+            put_bodies.append(self.rfile.read(int(self.headers["Content-Length"])))
+            self.send_response(200)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    thread = Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        url = f"http://127.0.0.1:{server.server_port}"
+        put_file_from_url(f"{url}/src/file.txt", f"{url}/dst", {})
+    finally:
+        server.shutdown()
+        server.server_close()
+
+    (headers,) = put_requests
+    assert headers["Content-Length"] == str(len(content))
+    assert "Transfer-Encoding" not in headers
+    assert put_bodies == [content]
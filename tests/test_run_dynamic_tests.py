@@ -0,0 +1,74 @@
+from pathlib import Path
+
+from bioimageio_collection_backoffice.s3_client import Client
+
+
+def test_test_inputs_hash():
+    from bioimageio_collection_backoffice.run_dynamic_tests import (
+        get_test_inputs_hash,
+    )
+
+    rdf_data = b"type: model\n"
+    files = [("concept/draft/files/rdf.yaml", "a"), ("concept/draft/files/w.pt", "b")]
+    h = get_test_inputs_hash(
+        rdf_data=rdf_data, files=files, weight_format="torchscript", conda_env=None
+    )
+    assert h == get_test_inputs_hash(
+        rdf_data=rdf_data,
+        files=files[::-1],
+        weight_format="torchscript",
+        conda_env=None,
+    )
+
+    # reuploaded package with an identical rdf.yaml, but different weights
+    assert h != get_test_inputs_hash(
+        rdf_data=rdf_data,
+        files=[files[0], ("concept/draft/files/w.pt", "changed")],
+        weight_format="torchscript",
+        conda_env=None,
+    )
+    # additional attachment
+    assert h != get_test_inputs_hash(
+        rdf_data=rdf_data,
+        files=[*files, ("concept/draft/files/extra.txt", "c")],
+        weight_format="torchscript",
+        conda_env=None,
+    )
+    assert h != get_test_inputs_hash(
+        rdf_data=rdf_data, files=files, weight_format="onnx", conda_env=None
+    )
+    assert h != get_test_inputs_hash(
+        rdf_data=rdf_data, files=files, weight_format="torchscript", conda_env=b"env"
+    )
+
+
+def test_test_result_path(non_collection_client: Client, tmp_path: Path):
+    from bioimageio_collection_backoffice.remote_collection import RecordDraft
+    from bioimageio_collection_backoffice.run_dynamic_tests import (
+        _get_test_result_path,  # pyright: ignore[reportPrivateUsage]
+    )
+
+    client = non_collection_client
+    draft = RecordDraft(client=client, concept_id="test-result-test")
+    client.put_and_cache(f"{draft.folder}files/rdf.yaml", b"type: model\n")
+    client.put_and_cache(f"{draft.folder}files/weights.pt", b"weights")
+    conda_env_file = tmp_path / "env.yaml"
+
+    path = _get_test_result_path(draft, "torchscript", "success", conda_env_file)
+    assert path is not None
+    assert path.startswith(f"{draft.folder}test_results/")
+    assert path == _get_test_result_path(
+        draft, "torchscript", "success", conda_env_file
+    )
+
+    # no stored results for failed environments or non-model resources
+    assert _get_test_result_path(draft, "torchscript", "", conda_env_file) is None
+    assert _get_test_result_path(draft, None, "success", conda_env_file) is None
+
+    # reupload with identical rdf.yaml, but different weights
+    client.put_and_cache(f"{draft.folder}files/weights.pt", b"new weights")
+    assert path != _get_test_result_path(
+        draft, "torchscript", "success", conda_env_file
+    )
+
+    client.rm_dir(draft.folder)
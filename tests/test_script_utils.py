@@ -0,0 +1,50 @@
+import os
+import stat
+from pathlib import Path
+from typing import List
+
+import pytest
+
+
+def test_write_atomically(tmp_path: Path):
+    from scripts.script_utils import (
+        _UMASK,  # pyright: ignore[reportPrivateUsage]
+        _write_atomically,  # pyright: ignore[reportPrivateUsage]
+    )
+
+    path = tmp_path / "sub" / "file.json"
+    _write_atomically(path, b"data")
+    assert path.read_bytes() == b"data"
+    assert stat.S_IMODE(os.stat(path).st_mode) == 0o666 & ~_UMASK
+
+    # a failed write leaves neither a temporary file nor a changed target
+    with pytest.raises(TypeError):
+        _write_atomically(path, "not bytes")  # type: ignore
+
+    assert path.read_bytes() == b"data"
+    assert [p.name for p in path.parent.iterdir()] == ["file.json"]
+
+
+def test_download_rdf_is_cached(tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+    import scripts.script_utils as script_utils
+
+    downloads: List[str] = []
+
+    def download_and_check_hash(url: str, sha256: str) -> bytes:
+        downloads.append(url)
+        return b"id: affable-shark\n"
+
+    monkeypatch.setattr(script_utils, "RDF_CACHE_DIR", tmp_path)
+    monkeypatch.setattr(
+        script_utils, "download_and_check_hash", download_and_check_hash
+    )
+
+    url = "https://example.com/rdf.yaml"
+    assert script_utils.download_rdf(url, "ab12") == {"id": "affable-shark"}
+    assert script_utils.download_rdf(url, "ab12") == {"id": "affable-shark"}
+    assert downloads == [url]
+    assert (tmp_path / "ab" / "ab12.yaml").exists()
+
+    # a different content hash is a cache miss
+    _ = script_utils.download_rdf(url, "cd34")
+    assert downloads == [url, url]
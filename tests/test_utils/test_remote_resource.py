@@ -1,5 +1,7 @@
 from bioimageio_collection_backoffice.backup import backup
+from bioimageio_collection_backoffice.collection_json import ConceptEntries
 from bioimageio_collection_backoffice.remote_collection import (
+    CONCEPT_ENTRIES_PREFIX,
     Record,
     RecordConcept,
     RecordDraft,
@@ -33,7 +35,35 @@ def test_lifecycle(
 
     remote_collection.generate_collection_json()
 
-    backup(client)
+    # concept entries are cached with the fingerprint of the concept's files
+    cache_path = f"{concept.folder}{CONCEPT_ENTRIES_PREFIX}published.json"
+
+    def get_cache_etag():
+        return dict(client.ls_files_with_etag(concept.folder)).get(cache_path)
+
+    def get_cached_fingerprint():
+        cached_data = client.load_file(cache_path)
+        assert cached_data is not None
+        return ConceptEntries.model_validate_json(cached_data).fingerprint
+
+    cache_etag = get_cache_etag()
+    assert cache_etag is not None
+    fingerprint = get_cached_fingerprint()
+
+    # cache hit: entries of an unchanged concept are not regenerated
+    remote_collection.generate_collection_json()
+    assert get_cache_etag() == cache_etag
+
+    # cache miss: changing a file of the concept regenerates its entries
+    extra_file = f"{published.folder}files/extra.json"
+    client.put_json(extra_file, "extra")
+    remote_collection.generate_collection_json()
+    assert get_cache_etag() != cache_etag
+    assert get_cached_fingerprint() != fingerprint
+    client.rm(extra_file)
+
+    assert backup(client) == [published.id]
+    assert backup(client) == []  # already backed up versions are skipped
 
     assert concept.doi is not None
     assert published.doi is not None
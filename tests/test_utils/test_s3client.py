@@ -1,3 +1,7 @@
+from typing import IO, List, Optional
+
+import pytest
+
 from bioimageio_collection_backoffice.s3_client import Client
 
 
@@ -15,3 +19,38 @@ def test_client(non_collection_client: Client):
     client.rm_dir("test_b/dir/")
     assert set(client.ls("test_b/")) == {"test1.json"}
     client.rm_dir("test_b/")
+
+
+def test_put_and_cache_skip_unchanged(
+    non_collection_client: Client, monkeypatch: pytest.MonkeyPatch
+):
+    client = non_collection_client
+    is_unchanged = client._is_unchanged  # pyright: ignore[reportPrivateUsage]
+    path = "test_skip/data.json"
+    assert not is_unchanged(path, b"data")
+
+    client.put_and_cache(path, b"data", skip_unchanged=True)
+    assert is_unchanged(path, b"data")
+    assert not is_unchanged(path, b"other")
+
+    uploaded: List[str] = []
+    put = client.put
+
+    def tracked_put(path: str, file_object: IO[bytes], length: Optional[int]):
+        uploaded.append(path)
+        put(path, file_object, length=length)
+
+    monkeypatch.setattr(client, "put", tracked_put)
+
+    # unchanged content is not uploaded again
+    client.put_and_cache(path, b"data", skip_unchanged=True)
+    assert not uploaded
+    assert client.load_file(path) == b"data"
+
+    # changed content is
+    client.put_and_cache(path, b"other", skip_unchanged=True)
+    assert uploaded == [path]
+    client.uncache()
+    assert client.load_file(path) == b"other"
+
+    client.rm_dir("test_skip/")